@@ -0,0 +1,107 @@
+"""
+Copyright (C) 2025 Fu Tszkok
+
+:module: Project 02-01 (Benchmark)
+:function: Throughput of the loop-based and the vectorized halftoning modes on full 816x1056 pages,
+           and the peak memory of whole-page and streamed halftoning to PBM files
+:author: Fu Tszkok
+:date: 2025-01-28
+:license: AGPLv3 + Additional Restrictions (Non-Commercial Use)
+
+This code is licensed under GNU Affero General Public License v3 (AGPLv3) with additional terms.
+- Commercial use prohibited (including but not limited to sale, integration into commercial products)
+- Academic use requires clear attribution in code comments or documentation
+
+Full AGPLv3 text available in LICENSE file or at <https://www.gnu.org/licenses/agpl-3.0.html>
+"""
+
+import os
+import itertools
+import time
+import tempfile
+import tracemalloc
+import halftone
+import cv2 as cv
+import numpy as np
+
+
+def halftoning_loop(image):
+    """
+    The original per-pixel implementation of halftoning, kept as the reference for timing.
+    :param image: Input grayscale image (NumPy array), typically with pixel values from 0-255.
+    :return: The halftoned image (NumPy array), which is 3 times larger than the original image.
+    """
+    image = np.floor(np.double(image) / 25.6)
+    row, col = image.shape
+    result = np.zeros((row * 3, col * 3))
+    for i in range(row):
+        for j in range(col):
+            result[i*3:i*3+3, j*3:j*3+3] = halftone.dot[:, :, int(image[i, j])]
+    return result
+
+
+def timing(func, *args, repeat=3):
+    """
+    Measures the best wall time of several calls to a function.
+    :param func: The function to be timed.
+    :param args: Positional arguments passed to the function.
+    :param repeat: Number of calls; the fastest one is reported.
+    :return: A tuple containing the best time in seconds and the last return value.
+    """
+    best, value = np.inf, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, value
+
+
+# Every page is a 272x352 image, which the halftoning turns into an 816x1056 page.
+pages = {name: cv.resize(cv.imread(f'../../images/{name}.bmp', cv.IMREAD_GRAYSCALE), (352, 272), interpolation=cv.INTER_AREA)
+         for name in ['Lenna_face', 'cameraman', 'crowd']}
+wedge = np.tile(np.linspace(0, 255, 352), (272, 1))
+pages['wedge'] = wedge
+
+print(f'{"Page":>12} | {"Mode":>16} | {"Time (s)":>9} | {"Pages/s":>8} | {"MPixel/s":>8} | {"Mean level":>10}')
+for name, page in pages.items():
+    runs = [('loop', halftoning_loop)] + [(mode, lambda x, mode=mode: halftone.halftoning(x, mode)) for mode in halftone.modes]
+    for mode, func in runs:
+        # The reference is only run once since it dominates the total running time.
+        seconds, result = timing(func, page, repeat=1 if mode == 'loop' else 3)
+        assert result.shape == (816, 1056)
+        print(f'{name:>12} | {mode:>16} | {seconds:>9.4f} | {1 / seconds:>8.1f} | {result.size / seconds / 1e6:>8.1f} | {result.mean():>10.2f}')
+
+# Compare halftoning whole pages before writing them with streaming the bands of each page to a
+# PBM file. The larger pages are printed at 2x and 4x the resolution of the 816x1056 page.
+# Tracing slows the row loop of the streamed Floyd-Steinberg diffusion many times over, so the
+# runs are timed untraced. The streamed peak is reached within the first bands, and only those
+# are traced.
+directory = tempfile.mkdtemp()
+print()
+print(f'{"Page":>12} | {"Mode":>16} | {"Whole (s)":>9} | {"Streamed (s)":>12} | {"Whole (MB)":>10} | {"Streamed (MB)":>13}')
+for factor in [1, 2, 4]:
+    page = cv.resize(pages['crowd'], (352 * factor, 272 * factor), interpolation=cv.INTER_LINEAR)
+    height, width = 3 * page.shape[0], 3 * page.shape[1]
+    for mode in halftone.modes:
+        def whole():
+            result = halftone.halftoning(page, mode).astype(np.uint8)
+            return halftone.write_pnm(os.path.join(directory, 'whole.pbm'), [result], width, height)
+
+        def streamed():
+            return halftone.write_pnm(os.path.join(directory, 'streamed.pbm'), halftone.halftone_bands(page, mode), width, height)
+
+        def first_bands():
+            for _ in itertools.islice(halftone.halftone_bands(page, mode), 2):
+                pass
+
+        times, memory = [], []
+        for run, traced in [(whole, whole), (streamed, first_bands)]:
+            start = time.perf_counter()
+            run()
+            times.append(time.perf_counter() - start)
+            tracemalloc.start()
+            traced()
+            memory.append(tracemalloc.get_traced_memory()[1] / 2 ** 20)
+            tracemalloc.stop()
+        label = f'{height}x{width}'
+        print(f'{label:>12} | {mode:>16} | {times[0]:>9.3f} | {times[1]:>12.3f} | {memory[0]:>10.1f} | {memory[1]:>13.1f}')
@@ -0,0 +1,272 @@
+"""
+Copyright (C) 2025 Fu Tszkok
+
+:module: halftone
+:function: The function package from Project 02-01 Image Printing Program Based on Halftoning
+:author: Fu Tszkok
+:date: 2025-01-28
+:license: AGPLv3 + Additional Restrictions (Non-Commercial Use)
+
+This code is licensed under GNU Affero General Public License v3 (AGPLv3) with additional terms.
+- Commercial use prohibited (including but not limited to sale, integration into commercial products)
+- Academic use requires clear attribution in code comments or documentation
+
+Full AGPLv3 text available in LICENSE file or at <https://www.gnu.org/licenses/agpl-3.0.html>
+"""
+
+import cv2 as cv
+import numpy as np
+
+# Define a 3x3x10 dot matrix for halftoning patterns.
+# Each slice `dot[:, :, n]` represents a 3x3 pixel pattern for a specific gray level (0-9).
+# These patterns simulate varying intensities of black dots on a white background.
+dot = np.zeros((3, 3, 10))
+dot[:, :, 1] = [[0, 255, 0], [0, 0, 0], [0, 0, 0]]
+dot[:, :, 2] = [[0, 255, 0], [0, 0, 0], [0, 0, 255]]
+dot[:, :, 3] = [[255, 255, 0], [0, 0, 0], [0, 0, 255]]
+dot[:, :, 4] = [[255, 255, 0], [0, 0, 0], [255, 0, 255]]
+dot[:, :, 5] = [[255, 255, 255], [0, 0, 0], [255, 0, 255]]
+dot[:, :, 6] = [[255, 255, 255], [0, 0, 255], [255, 0, 255]]
+dot[:, :, 7] = [[255, 255, 255], [0, 0, 255], [255, 255, 255]]
+dot[:, :, 8] = [[255, 255, 255], [255, 0, 255], [255, 255, 255]]
+dot[:, :, 9] = [[255, 255, 255], [255, 255, 255], [255, 255, 255]]
+
+# The 4x4 Bayer matrix of the ordered dither. Its entries are the order in which the
+# pixels of a 4x4 cell turn white as the gray level rises.
+bayer = np.array([[0, 8, 2, 10],
+                  [12, 4, 14, 6],
+                  [3, 11, 1, 9],
+                  [15, 7, 13, 5]])
+
+modes = ('pattern', 'floyd-steinberg', 'ordered')
+
+
+def adaption(image):
+    """
+    Adjusts image size to fit specific dimension constraints.
+    :param image: Input grayscale image (NumPy array).
+    :return: Resized image (NumPy array).
+    """
+    row, col = image.shape
+    # Calculate scaling factors based on a target size (816/3 x 1056/3).
+    rscale = row / (816 / 3)
+    cscale = col / (1056 / 3)
+    # Determine the overall scaling factor to fit within the target dimensions.
+    scale = 1 / max(cscale, rscale)
+    # Resize the image using the calculated scale.
+    result = cv.resize(image, (0, 0), None, scale, scale)
+    return result
+
+
+def halftoning(image, mode='pattern'):
+    """
+    Converts a grayscale image into a halftoned image.
+    :param image: Input grayscale image (NumPy array), typically with pixel values from 0-255.
+    :param mode: The halftoning method: 'pattern' places the 3x3 dot pattern of each pixel's gray level,
+                 'floyd-steinberg' diffuses the quantization error and 'ordered' thresholds with a
+                 Bayer matrix. The last two binarize the image replicated to the 3x resolution.
+    :return: The halftoned image (NumPy array), which is 3 times larger than the original image.
+    """
+    if mode not in modes:
+        raise ValueError(f'Unknown halftoning mode {mode!r}, expected one of {modes}.')
+    if mode == 'pattern':
+        return pattern_halftoning(image)
+
+    # Replicate every pixel into a 3x3 block to reach the printing resolution.
+    image = np.repeat(np.repeat(np.double(image), 3, axis=0), 3, axis=1)
+    if mode == 'ordered':
+        return ordered_dither(image)
+    return floyd_steinberg(image)
+
+
+def pattern_halftoning(image):
+    """
+    Places the 3x3 dot pattern of every pixel's gray level with a single table lookup.
+    :param image: Input grayscale image (NumPy array), typically with pixel values from 0-255.
+    :return: The halftoned image (NumPy array), which is 3 times larger than the original image.
+    """
+    # Normalize image pixel values to a range of 0-9 for dot matrix lookup.
+    levels = np.floor(np.double(image) / 25.6).astype(np.intp)
+    row, col = levels.shape
+    # Look up the (row, col, 3, 3) patterns and interleave their rows and columns
+    # into the (row * 3, col * 3) canvas.
+    patterns = dot.transpose(2, 0, 1)[levels]
+    return patterns.transpose(0, 2, 1, 3).reshape(row * 3, col * 3)
+
+
+def ordered_dither(image, offset=0):
+    """
+    Binarizes an image by comparing every pixel with the tiled Bayer threshold matrix.
+    :param image: Input grayscale image (NumPy array) with pixel values from 0-255.
+    :param offset: The row of the page at which the image starts, which aligns the tiling of a band.
+    :return: The binary image (NumPy array of 0 and 255) of the same size.
+    """
+    row, col = image.shape
+    # Spread the 16 thresholds evenly over the 0-255 range.
+    thresholds = (bayer + 0.5) * (256 / 16)
+    thresholds = np.roll(thresholds, -offset, axis=0)
+    thresholds = np.tile(thresholds, (row // 4 + 1, col // 4 + 1))[:row, :col]
+    return np.where(image >= thresholds, 255.0, 0.0)
+
+
+def floyd_steinberg(image):
+    """
+    Binarizes an image with Floyd-Steinberg error diffusion.
+    :param image: Input grayscale image (NumPy array) with pixel values from 0-255.
+    :return: The binary image (NumPy array of 0 and 255) of the same size.
+    """
+    row, col = image.shape
+    # The work buffer has a margin column on each side and a margin row below,
+    # which absorb the error diffused beyond the image.
+    work = np.zeros((row + 1, col + 2))
+    work[:row, 1:col + 1] = image
+    return _diffuse(work)
+
+
+def _diffuse(work):
+    """
+    Runs Floyd-Steinberg error diffusion over a work buffer in place.
+    :param work: The image with a margin column on each side and a margin row below (NumPy array).
+                 The margin row receives the error diffused into the next row.
+    :return: The binary image (NumPy array of 0 and 255) without the margins.
+    """
+    row, col = work.shape[0] - 1, work.shape[1] - 2
+    result = np.zeros((row, col))
+
+    # A pixel receives error from its left neighbour and from the three pixels above it.
+    # All pixels on the line t = 2 * y + x have their inputs complete once the lines
+    # before t are done, so each line is quantized as one vectorized step.
+    for t in range(2 * (row - 1) + col):
+        y = np.arange(max(0, (t - col) // 2 + 1), min(row - 1, t // 2) + 1)
+        x = t - 2 * y + 1
+        value = work[y, x]
+        output = np.where(value >= 128, 255.0, 0.0)
+        result[y, x - 1] = output
+        error = value - output
+        # Each target is unique within one statement, and targets shared by two pixels of
+        # the same line are updated by different statements, so no contribution is lost.
+        work[y, x + 1] += error * (7 / 16)
+        work[y + 1, x - 1] += error * (3 / 16)
+        work[y + 1, x] += error * (5 / 16)
+        work[y + 1, x + 1] += error * (1 / 16)
+    return result
+
+
+def halftone_bands(image, mode='pattern', band=64):
+    """
+    Halftones an image band by band, so that only one band of the page is held in memory.
+    Floyd-Steinberg diffusion also carries the error of one page row from band to band.
+    :param image: Input grayscale image (NumPy array, possibly memory-mapped) with pixel values from 0-255.
+    :param mode: The halftoning method, as in halftoning.
+    :param band: The number of image rows per band; each band yields 3 times as many page rows.
+    :return: A generator of the page bands (NumPy arrays of uint8), which concatenate to halftoning(image, mode).
+    """
+    if mode not in modes:
+        raise ValueError(f'Unknown halftoning mode {mode!r}, expected one of {modes}.')
+    if mode == 'floyd-steinberg':
+        yield from _diffuse_bands(image, band)
+        return
+    row, col = image.shape
+    for start in range(0, row, band):
+        stop = min(start + band, row)
+        chunk = np.double(image[start:stop])
+        if mode == 'pattern':
+            yield pattern_halftoning(chunk).astype(np.uint8)
+            continue
+
+        # Replicate every pixel into a 3x3 block to reach the printing resolution.
+        chunk = np.repeat(np.repeat(chunk, 3, axis=0), 3, axis=1)
+        yield ordered_dither(chunk, 3 * start).astype(np.uint8)
+
+
+def _diffuse_bands(image, band):
+    """
+    Runs Floyd-Steinberg error diffusion row by row, holding only the error of the next row.
+    The working set is O(width) whatever the page size, besides the band being filled.
+    :param image: Input grayscale image (NumPy array, possibly memory-mapped) with pixel values from 0-255.
+    :param band: The number of image rows per band; each band yields 3 times as many page rows.
+    :return: A generator of the page bands (NumPy arrays of uint8), which concatenate to floyd_steinberg.
+    """
+    row, col = image.shape
+    height, width = 3 * row, 3 * col
+    rows = np.zeros((min(3 * band, height), width), dtype=np.uint8)
+    filled = 0
+    # The current row with the error it received from above, and the 3/16 share from its
+    # upper right neighbour kept apart, one margin column on each side.
+    current = [0.0] + np.repeat(np.double(image[0]), 3).tolist() + [0.0]
+    late = [0.0] * (width + 2)
+
+    for y in range(height):
+        # The next row starts from its gray values; the row below the page only absorbs error.
+        if y + 1 < height:
+            below = [0.0] + np.repeat(np.double(image[(y + 1) // 3]), 3).tolist() + [0.0]
+        else:
+            below = [0.0] * (width + 2)
+        below_late = [0.0] * (width + 2)
+        output = rows[filled]
+        carry = 0.0
+        for x in range(1, width + 1):
+            # Add the errors in the order _diffuse does: the two from above, then the one
+            # from the left, then the one from above right, so the sums match bit for bit.
+            value = current[x] + carry + late[x]
+            level = 255.0 if value >= 128 else 0.0
+            output[x - 1] = level
+            error = value - level
+            carry = error * (7 / 16)
+            below_late[x - 1] += error * (3 / 16)
+            below[x] += error * (5 / 16)
+            below[x + 1] += error * (1 / 16)
+        current, late = below, below_late
+
+        # Emit the band as soon as its last row is final.
+        filled += 1
+        if filled == len(rows) or y == height - 1:
+            yield rows[:filled].copy()
+            filled = 0
+
+
+def write_pnm(path, bands, width, height):
+    """
+    Writes page bands to a binary PBM (.pbm) or PGM (.pgm) file as they are produced.
+    :param path: The path of the file; its suffix selects the format.
+    :param bands: An iterable of page bands (NumPy arrays of uint8) with the given width.
+    :param width: The width of the page.
+    :param height: The height of the page, i.e. the total number of rows of the bands.
+    :return: The number of rows written.
+    """
+    if path.endswith('.pbm'):
+        header = f'P4\n{width} {height}\n'
+    elif path.endswith('.pgm'):
+        header = f'P5\n{width} {height}\n255\n'
+    else:
+        raise ValueError('The file must be a .pbm or .pgm file.')
+
+    written = 0
+    with open(path, 'wb') as file:
+        file.write(header.encode('ascii'))
+        for rows in bands:
+            if path.endswith('.pbm'):
+                # A set bit is a black pixel, and every row is padded to a whole byte.
+                rows = np.packbits(rows < 128, axis=1)
+            file.write(np.ascontiguousarray(rows).tobytes())
+            written += rows.shape[0]
+    if written != height:
+        raise ValueError(f'The bands hold {written} rows instead of {height}.')
+    return written
+
+
+def print_page(image, path, mode='pattern', band=64):
+    """
+    Fits an image to the 816x1056 page and streams its halftoned page to a PBM or PGM file.
+    :param image: Input grayscale image (NumPy array).
+    :param path: The path of the .pbm or .pgm file.
+    :param mode: The halftoning method, as in halftoning.
+    :param band: The number of image rows halftoned at a time.
+    :return: The number of page rows written.
+    """
+    row, col = image.shape
+    # Adapt image size if it exceeds the specified dimensions.
+    if (row > (816 / 3)) or (col > (1056 / 3)):
+        image = adaption(image)
+    row, col = image.shape
+    return write_pnm(path, halftone_bands(image, mode, band), col * 3, row * 3)
@@ -0,0 +1,79 @@
+"""
+Copyright (C) 2025 Fu Tszkok
+
+:module: Project 02-02 (Benchmark)
+:function: Timing of the per-pixel halving loop against the bit-shift sweep, and the cost and mean error
+           of quantizing to arbitrary level counts with and without dithering
+:author: Fu Tszkok
+:date: 2025-01-28
+:license: AGPLv3 + Additional Restrictions (Non-Commercial Use)
+
+This code is licensed under GNU Affero General Public License v3 (AGPLv3) with additional terms.
+- Commercial use prohibited (including but not limited to sale, integration into commercial products)
+- Academic use requires clear attribution in code comments or documentation
+
+Full AGPLv3 text available in LICENSE file or at <https://www.gnu.org/licenses/agpl-3.0.html>
+"""
+
+import time
+import graylevel
+import cv2 as cv
+import numpy as np
+
+
+def sweep_loop(image):
+    """
+    The original per-pixel implementation of the gray level reduction, kept as the reference for timing.
+    :param image: Input grayscale image (NumPy array of uint8).
+    :return: The 128- through 2-level images (NumPy array of uint8 with a leading axis over the levels).
+    """
+    image = image.copy()
+    versions = []
+    for k in range(7):
+        for i in range(image.shape[0]):
+            for j in range(image.shape[1]):
+                image[i, j] /= 2
+        versions.append(image.copy())
+    return np.array(versions)
+
+
+def timing(func, *args, repeat=3):
+    """
+    Measures the best wall time of several calls to a function.
+    :param func: The function to be timed.
+    :param args: Positional arguments passed to the function.
+    :param repeat: Number of calls; the fastest one is reported.
+    :return: A tuple containing the best time in seconds and the last return value.
+    """
+    best, value = np.inf, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, value
+
+
+images = {name: cv.imread(f'../../images/{name}.bmp', cv.IMREAD_GRAYSCALE)
+          for name in ['ctskull-256', 'cameraman', 'Lenna_face']}
+
+# The full 7-step sweep, by the loop and by one broadcast shift.
+print(f'{"Image":>12} | {"Size":>9} | {"Loop (s)":>9} | {"Shift (s)":>9} | {"Speedup":>8} | {"Identical":>9}')
+for name, image in images.items():
+    # The reference is only run once since it dominates the total running time.
+    loop, reference = timing(sweep_loop, image, repeat=1)
+    shift, versions = timing(graylevel.bit_sweep, image, range(7, 0, -1))
+    label = f'{image.shape[0]}x{image.shape[1]}'
+    identical = np.array_equal(reference, versions)
+    print(f'{name:>12} | {label:>9} | {loop:>9.3f} | {shift:>9.5f} | {loop / shift:>8.0f} | {identical!s:>9}')
+
+# Arbitrary level counts: the time per image and how far the mean gray value drifts
+# from the original, which dithering is meant to remove.
+image = images['ctskull-256']
+print()
+print(f'{"Levels":>6} | {"Dither":>8} | {"Time (ms)":>9} | {"Mean error":>10} | {"RMS error":>9}')
+for levels in [3, 6, 12, 100]:
+    for dither in graylevel.dithers:
+        seconds, result = timing(graylevel.quantize, image, levels, dither, True, 0)
+        difference = np.double(result) - image
+        print(f'{levels:>6} | {dither or "none":>8} | {seconds * 1e3:>9.3f} | '
+              f'{abs(difference.mean()):>10.3f} | {np.sqrt((difference ** 2).mean()):>9.2f}')
@@ -14,6 +14,7 @@ This code is licensed under GNU Affero General Public License v3 (AGPLv3) with a
 Full AGPLv3 text available in LICENSE file or at <https://www.gnu.org/licenses/agpl-3.0.html>
 """
 
+import graylevel
 import cv2 as cv
 import matplotlib.pyplot as plt
 
@@ -26,21 +27,27 @@ plt.imshow(image, cmap='gray')
 plt.title("Original Image")
 plt.show()
 
+# Produce the 128- through 2-level images at once. Halving every pixel k times is the same
+# as shifting it right by k bits, so all versions come from one broadcast shift.
+versions = graylevel.bit_sweep(image, range(7, 0, -1))
+
 # Initialize the current grayscale level. For an 8-bit image, it starts at 256 levels (0-255).
 grayscale = 256
 
-# Iterate 7 times to progressively reduce grayscale levels
-for k in range(7):
-    # Iterate through each pixel of the image
-    for i in range(image.shape[0]):
-        for j in range(image.shape[1]):
-            # Divide each pixel value by 2, effectively reducing the number of grayscale levels
-            image[i, j] /= 2
-
+# Display the 7 images with progressively reduced grayscale levels
+for version in versions:
     # Update the displayed grayscale level count
     grayscale /= 2
     # Display the image with reduced grayscale levels
     plt.axis('off')
-    plt.imshow(image, cmap='gray')
+    plt.imshow(version, cmap='gray')
     plt.title(f"Grayscale {grayscale} Image")
     plt.show()
+
+# Quantize to a level count that is not a power of 2, without and with the ordered dither
+for dither in [None, 'ordered']:
+    result = graylevel.quantize(image, 6, dither, spread=True)
+    plt.axis('off')
+    plt.imshow(result, cmap='gray', vmin=0, vmax=255)
+    plt.title(f"Grayscale 6 Image ({dither or 'plain'})")
+    plt.show()
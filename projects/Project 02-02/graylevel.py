@@ -0,0 +1,93 @@
+"""
+Copyright (C) 2025 Fu Tszkok
+
+:module: graylevel
+:function: The function package from Project 02-02 Reducing the Number of Gray Levels in an Image
+:author: Fu Tszkok
+:date: 2025-01-28
+:license: AGPLv3 + Additional Restrictions (Non-Commercial Use)
+
+This code is licensed under GNU Affero General Public License v3 (AGPLv3) with additional terms.
+- Commercial use prohibited (including but not limited to sale, integration into commercial products)
+- Academic use requires clear attribution in code comments or documentation
+
+Full AGPLv3 text available in LICENSE file or at <https://www.gnu.org/licenses/agpl-3.0.html>
+"""
+
+import numpy as np
+
+# The 4x4 Bayer matrix of the ordered dither. Its entries are the order in which the
+# pixels of a 4x4 cell step up to the next level as the gray level rises.
+bayer = np.array([[0, 8, 2, 10],
+                  [12, 4, 14, 6],
+                  [3, 11, 1, 9],
+                  [15, 7, 13, 5]])
+
+dithers = (None, 'ordered', 'random')
+
+
+def reduce_bits(image, bits):
+    """
+    Reduces an 8-bit image to the given number of bits by dropping its low bits.
+    :param image: Input grayscale image (NumPy array of uint8).
+    :param bits: The number of bits kept (1-8), i.e. 2 ** bits gray levels.
+    :return: The image of level indices from 0 to 2 ** bits - 1 (NumPy array of uint8).
+    """
+    if not 1 <= bits <= 8:
+        raise ValueError(f'The number of bits must be from 1 to 8, got {bits}.')
+    return np.right_shift(image, 8 - bits)
+
+
+def bit_sweep(image, bits=range(8, 0, -1)):
+    """
+    Produces all k-bit versions of an 8-bit image at once with bit shifts.
+    Halving every pixel k times is the same as shifting it right by k bits.
+    :param image: Input grayscale image (NumPy array of uint8).
+    :param bits: The numbers of bits kept, from 256 levels down to 2 by default.
+    :return: The stacked versions (NumPy array of uint8 with a leading axis over bits).
+    """
+    bits = np.asarray(bits)
+    if np.any((bits < 1) | (bits > 8)):
+        raise ValueError(f'The numbers of bits must be from 1 to 8, got {bits.tolist()}.')
+    shifts = (8 - bits).astype(np.uint8).reshape((-1,) + (1,) * np.ndim(image))
+    # One broadcast shift fills the whole stack.
+    return np.right_shift(image[None], shifts)
+
+
+def quantize(image, levels, dither=None, spread=False, seed=None):
+    """
+    Quantizes an 8-bit image to an arbitrary number of equally spaced gray levels.
+    :param image: Input grayscale image (NumPy array) with pixel values from 0-255.
+    :param levels: The number of gray levels (2-256).
+    :param dither: None for plain quantization, 'ordered' to add the tiled Bayer thresholds
+                   or 'random' to add uniform noise before the levels are rounded down.
+    :param spread: Whether to map the level indices back to the 0-255 range.
+    :param seed: The seed of the random dither.
+    :return: The image of level indices, or of their gray values if spread (NumPy array of uint8).
+    """
+    if not 2 <= levels <= 256:
+        raise ValueError(f'The number of levels must be from 2 to 256, got {levels}.')
+    if dither not in dithers:
+        raise ValueError(f'Unknown dither {dither!r}, expected one of {dithers}.')
+    image = np.asarray(image)
+
+    if dither is None:
+        # Split 0-255 into equal bins; for a power of 2 this equals reduce_bits.
+        result = np.floor_divide(image.astype(np.intp) * levels, 256)
+    else:
+        # Measure the pixels in units of the level spacing and round down after adding a
+        # threshold from [0, 1), so that the mean level matches the original gray value.
+        scaled = np.double(image) * ((levels - 1) / 255)
+        row, col = image.shape[:2]
+        if dither == 'ordered':
+            thresholds = (bayer + 0.5) / 16
+            thresholds = np.tile(thresholds, (row // 4 + 1, col // 4 + 1))[:row, :col]
+        else:
+            thresholds = np.random.default_rng(seed).random((row, col))
+        if image.ndim == 3:
+            thresholds = thresholds[:, :, None]
+        result = np.minimum(np.floor(scaled + thresholds), levels - 1)
+
+    if spread:
+        result = np.round(result * (255 / (levels - 1)))
+    return result.astype(np.uint8)
@@ -14,49 +14,51 @@ This code is licensed under GNU Affero General Public License v3 (AGPLv3) with a
 Full AGPLv3 text available in LICENSE file or at <https://www.gnu.org/licenses/agpl-3.0.html>
 """
 
+import bilinear
 import cv2 as cv
 import numpy as np
 import matplotlib.pyplot as plt
 
 
-def nearest_neighbor_interpolation(image, new_width, new_height):
+def nearest_neighbor_interpolation(image, new_width, new_height, batch=False):
     """Performs image scaling using nearest neighbor interpolation.
-    :param image: The input image before scaling.
+    :param image: The input image before scaling, of shape (H, W), (H, W, C), (N, H, W) or (N, H, W, C).
     :param new_width: The width of the scaled output image.
     :param new_height: The height of the scaled output image.
-    :return: The scaled image (NumPy array).
+    :param batch: Whether a three-dimensional image is a batch (N, H, W) rather than (H, W, C).
+    :return: The scaled image (NumPy array) with the same layout as the input.
     """
     # Convert the input image to a floating-point array for interpolation calculations.
     image = np.array(image, dtype=np.float64)
-    old_height, old_width = image.shape  # Get the dimensions of the original image.
-
-    # Create a new blank image with the desired size, initialized with zeros.
-    new_image = np.zeros((new_height, new_width), dtype=np.float64)
+    # View every layout as (N, H, W, C) so all frames and channels are scaled in one pass.
+    axis = bilinear.spatial_axis(image.shape, batch)
+    leading, trailing = image.shape[:axis], image.shape[axis + 2:]
+    old_height, old_width = image.shape[axis:axis + 2]  # Get the dimensions of the original image.
+    image = image.reshape((int(np.prod(leading)), old_height, old_width, int(np.prod(trailing))))
 
     # Calculate the scaling factors for the x and y axes.
     scale_x = old_width / new_width
     scale_y = old_height / new_height
 
-    # Iterate through each pixel of the new (output) image.
-    for y in range(new_height):
-        for x in range(new_width):
-            # Calculate the corresponding coordinates in the original image (inverse mapping).
-            src_x = int((x + 0.5) * scale_x - 0.5)
-            src_y = int((y + 0.5) * scale_y - 0.5)
+    # Calculate the corresponding coordinates in the original image (inverse mapping)
+    # for every output column and row at once.
+    src_x = ((np.arange(new_width) + 0.5) * scale_x - 0.5).astype(int)
+    src_y = ((np.arange(new_height) + 0.5) * scale_y - 0.5).astype(int)
 
-            # Ensure the calculated coordinates are within the valid range of the original image.
-            # This implementation incorrectly averages four pixels instead of picking the nearest one.
-            x1 = max(min(src_x, old_width - 1), 0)
-            y1 = max(min(src_y, old_height - 1), 0)
-            x2 = max(min(x1 + 1, old_width - 1), 0)
-            y2 = max(min(y1 + 1, old_height - 1), 0)
+    # Ensure the calculated coordinates are within the valid range of the original image.
+    # This implementation incorrectly averages four pixels instead of picking the nearest one.
+    x1 = np.clip(src_x, 0, old_width - 1)
+    y1 = np.clip(src_y, 0, old_height - 1)
+    x2 = np.clip(x1 + 1, 0, old_width - 1)
+    y2 = np.clip(y1 + 1, 0, old_height - 1)
 
-            # Calculate the average value of the four neighboring pixels as the new pixel value.
-            # This is not a true nearest neighbor interpolation but a simple averaging method.
-            ave_value = np.uint8((image[y1, x1] + image[y1, x2] + image[y2, x1] + image[y2, x2]) / 4)
+    # Calculate the average value of the four neighboring pixels as the new pixel value.
+    # This is not a true nearest neighbor interpolation but a simple averaging method.
+    top, bottom = image[:, y1], image[:, y2]
+    ave_value = np.uint8((top[:, :, x1] + top[:, :, x2] + bottom[:, :, x1] + bottom[:, :, x2]) / 4)
 
-            # Assign the calculated value to the new image's pixel and clip it to the 0-255 range.
-            new_image[y, x] = np.clip(ave_value, 0, 255)
+    # Convert the averaged values back to floating point; they already lie in the 0-255 range.
+    new_image = np.float64(ave_value).reshape(leading + (new_height, new_width) + trailing)
 
     return new_image
 
@@ -92,3 +94,14 @@ plt.axis('off')
 plt.imshow(loss, cmap='gray')
 plt.title('Loss Image')
 plt.show()
+
+# Shrink the image again by area averaging, which uses all 16 pixels of every 4x4 block
+# instead of 4 of them, and zoom it back the same way to compare the losses.
+area_resized_down = np.uint8(bilinear.area_interpolation(image, 256, 256))
+area_resized_up = np.uint8(nearest_neighbor_interpolation(area_resized_down, 1024, 1024))
+area_loss = np.abs(np.float64(area_resized_up) - np.float64(image))
+print(f'Average Loss (area shrink): {np.mean(area_loss)}')
+plt.axis('off')
+plt.imshow(area_resized_down, cmap='gray')
+plt.title('Scaled Down Image (Area)')
+plt.show()
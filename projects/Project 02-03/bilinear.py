@@ -0,0 +1,381 @@
+"""
+Copyright (C) 2025 Fu Tszkok
+
+:module: bilinear
+:function: The function package from Project 02-04 Zooming and Shrinking Images by Bilinear Interpolation
+:author: Fu Tszkok
+:date: 2025-01-28
+:license: AGPLv3 + Additional Restrictions (Non-Commercial Use)
+
+This code is licensed under GNU Affero General Public License v3 (AGPLv3) with additional terms.
+- Commercial use prohibited (including but not limited to sale, integration into commercial products)
+- Academic use requires clear attribution in code comments or documentation
+
+Full AGPLv3 text available in LICENSE file or at <https://www.gnu.org/licenses/agpl-3.0.html>
+"""
+
+import struct
+import functools
+import numpy as np
+
+
+def source_coordinates(old_size, new_size):
+    """Computes the inverse mapping of one axis with the half-pixel-center convention.
+    :param old_size: The length of the axis in the original image.
+    :param new_size: The length of the axis in the scaled image.
+    :return: A tuple (i1, i2, d) of the two neighbouring source indices and the weight of i2.
+    """
+    scale = old_size / new_size  # Calculate the scaling factor of the axis.
+    src = (np.arange(new_size) + 0.5) * scale - 0.5
+    # Truncate towards zero as int() does, so the first output pixels of an upscale
+    # extrapolate from the first two source pixels.
+    i1 = src.astype(np.intp)
+    i2 = np.minimum(i1 + 1, old_size - 1)  # Ensure it doesn't go out of bounds.
+    return i1, i2, src - i1
+
+
+def area_coordinates(old_size, new_size):
+    """Computes the source interval covered by every output pixel of one axis.
+    :param old_size: The length of the axis in the original image.
+    :param new_size: The length of the axis in the scaled image.
+    :return: A tuple (k, f, scale) of the source pixel containing each of the new_size + 1 interval
+             edges, the fraction of that pixel before the edge and the interval length.
+    """
+    scale = old_size / new_size
+    edges = np.arange(new_size + 1) * scale
+    # The last edge lies on the end of the axis, i.e. after all of the last pixel.
+    k = np.minimum(edges.astype(np.intp), old_size - 1)
+    return k, edges - k, scale
+
+
+def spatial_axis(shape, batch=False):
+    """Locates the height and width axes of an image, a color image or a batch of them.
+    :param shape: The shape of the array, (H, W), (H, W, C), (N, H, W) or (N, H, W, C).
+    :param batch: Whether the first axis of a three-dimensional array indexes frames (N, H, W)
+                  rather than the last axis indexing channels (H, W, C).
+    :return: The index of the height axis; the width axis follows it.
+    """
+    if not 2 <= len(shape) <= 4:
+        raise ValueError(f'Expected an array of shape (H, W), (H, W, C), (N, H, W) or (N, H, W, C), not {shape}.')
+    return 1 if batch or len(shape) == 4 else 0
+
+
+class ResizePlan:
+    """The index and weight tables of a resize from one image shape to another.
+
+    The tables only depend on the geometry, so a plan can be applied to any number of
+    images of the input shape at the cost of a gather and a blend per image. All channels
+    and frames of a color image or a batch are resized together in one pass.
+
+    The 'bilinear' method interpolates between the four nearest source pixels. The 'area' method
+    averages every source pixel an output pixel covers, weighted by the covered fraction, which
+    avoids aliasing when shrinking by large factors. It uses a reshape when the shrink factors are
+    integers and segment sums along each axis otherwise, so each source pixel is read once per axis.
+    """
+
+    methods = ('bilinear', 'area')
+
+    def __init__(self, old_shape, new_shape, method='bilinear'):
+        """Builds the tables of a resize.
+        :param old_shape: The shape (height, width) of the input images.
+        :param new_shape: The shape (height, width) of the output images.
+        :param method: The interpolation method, 'bilinear' or 'area'.
+        """
+        if method not in self.methods:
+            raise ValueError(f'Unknown resize method {method!r}, expected one of {self.methods}.')
+        self.old_shape = tuple(old_shape)
+        self.new_shape = tuple(new_shape)
+        self.method = method
+
+        # The tables are shaped to broadcast over images arranged as (N, H, W, C).
+        if method == 'bilinear':
+            # Compute the source coordinates and both weights of every output row and column once.
+            self.y1, self.y2, dy = source_coordinates(self.old_shape[0], self.new_shape[0])
+            self.x1, self.x2, dx = source_coordinates(self.old_shape[1], self.new_shape[1])
+            self.dy, self.wy = dy[:, None, None], 1 - dy[:, None, None]
+            self.dx, self.wx = dx[:, None], 1 - dx[:, None]
+            # The same weights in Q7 fixed point for 8-bit images. Each pair sums to exactly 128, and
+            # the negative weights at the upscale edges are stored modulo 2^16 in the horizontal table.
+            qx, qy = np.rint(dx * 128).astype(np.int32), np.rint(dy * 128).astype(np.int32)
+            self.qdx, self.qwx = qx.astype(np.uint16)[:, None], (128 - qx).astype(np.uint16)[:, None]
+            self.qdy, self.qwy = qy[:, None, None], (128 - qy)[:, None, None]
+            tables = (self.y1, self.y2, self.dy, self.wy, self.x1, self.x2, self.dx, self.wx,
+                      self.qdx, self.qwx, self.qdy, self.qwy)
+        else:
+            # Integer shrink factors average whole blocks, which a reshape does directly.
+            factors = [old // new for old, new in zip(self.old_shape, self.new_shape)]
+            exact = all(old == new * factor for old, new, factor in zip(self.old_shape, self.new_shape, factors))
+            self.blocks = factors if exact and min(factors) >= 1 else None
+            self.ky, fy, self.sy = area_coordinates(self.old_shape[0], self.new_shape[0])
+            self.kx, fx, self.sx = area_coordinates(self.old_shape[1], self.new_shape[1])
+            self.fy, self.fx = fy[:, None, None], fx[:, None]
+            tables = (self.ky, self.fy, self.kx, self.fx)
+        # The plan is shared through resize_plan, so its tables are read-only.
+        for table in tables:
+            table.setflags(write=False)
+
+    def apply(self, image, batch=False, preserve_dtype=False):
+        """Resizes an image with the tables of this plan.
+        :param image: The input image of shape (H, W), (H, W, C), (N, H, W) or (N, H, W, C),
+                      where (H, W) must be the input shape of the plan.
+        :param batch: Whether a three-dimensional image is a batch (N, H, W) rather than (H, W, C).
+        :param preserve_dtype: Whether an 8-bit image is resized to an 8-bit image, see apply_rows.
+        :return: The scaled image (NumPy array of float64) with the same layout as the input.
+        """
+        return self.apply_rows(image, 0, self.new_shape[0], batch, preserve_dtype)
+
+    def source_rows(self, start, stop):
+        """Finds the source rows read by a band of output rows, including the halo rows
+        that the interpolation or the partially covered areas reach into.
+        :param start: The first output row of the band.
+        :param stop: The output row after the band.
+        :return: A tuple (first, last) of the source row range [first, last).
+        """
+        if self.method == 'area':
+            if self.blocks is not None:
+                return start * self.blocks[0], stop * self.blocks[0]
+            return int(self.ky[start]), int(self.ky[stop]) + 1
+        return int(self.y1[start]), int(self.y2[stop - 1]) + 1
+
+    def apply_rows(self, image, start, stop, batch=False, preserve_dtype=False):
+        """Computes a band of output rows, converting only the source rows it reads. The image
+        may be a memory-mapped array, of which only that band is loaded.
+        :param image: The input image of shape (H, W), (H, W, C), (N, H, W) or (N, H, W, C),
+                      where (H, W) must be the input shape of the plan.
+        :param start: The first output row of the band.
+        :param stop: The output row after the band.
+        :param batch: Whether a three-dimensional image is a batch (N, H, W) rather than (H, W, C).
+        :param preserve_dtype: Whether an 8-bit image is resized to an 8-bit image rounded to the nearest
+                               level. The bilinear method then runs in fixed point without float arrays.
+        :return: The output rows [start, stop) (NumPy array of float64, or uint8 when the dtype is
+                 preserved) with the layout of the input.
+        """
+        image = np.asarray(image)
+        axis = spatial_axis(image.shape, batch)
+        if image.shape[axis:axis + 2] != self.old_shape:
+            raise ValueError(f'The plan resizes images of shape {self.old_shape}, not {image.shape[axis:axis + 2]}.')
+        fixed = preserve_dtype and image.dtype == np.uint8
+        first, last = self.source_rows(start, stop)
+        band = image[(slice(None),) * axis + (slice(first, last),)]
+        if not (fixed and self.method == 'bilinear'):
+            band = band.astype(np.float64)
+
+        # View every layout as (N, H, W, C) so the frames and channels share the tables.
+        leading, trailing = band.shape[:axis], band.shape[axis + 2:]
+        stack = band.reshape((int(np.prod(leading)),) + band.shape[axis:axis + 2] + (int(np.prod(trailing)),))
+        if self.method == 'area':
+            new_stack = self._area(stack, start, stop, first)
+            if fixed:
+                new_stack = np.rint(new_stack).astype(np.uint8)
+        elif fixed:
+            new_stack = self._bilinear_fixed(stack, start, stop, first)
+        else:
+            new_stack = self._bilinear(stack, start, stop, first)
+        return new_stack.reshape(leading + (stop - start, self.new_shape[1]) + trailing)
+
+    def _bilinear(self, stack, start, stop, first):
+        # Perform linear interpolation in the x-direction for every row of the source band.
+        rows = stack[:, :, self.x1]
+        rows *= self.wx
+        rows += stack[:, :, self.x2] * self.dx
+        # Perform linear interpolation in the y-direction between the top and bottom rows.
+        new_stack = rows[:, self.y1[start:stop] - first]
+        new_stack *= self.wy[start:stop]
+        new_stack += rows[:, self.y2[start:stop] - first] * self.dy[start:stop]
+
+        # Clip the result to the 0-255 range.
+        return np.clip(new_stack, 0, 255, out=new_stack)
+
+    def _bilinear_fixed(self, stack, start, stop, first):
+        # Interpolate in the x-direction in uint16. The exact results lie in [-16320, 48960]
+        # (the edge weights reach -64 and 192), so with a bias of 2^14 they fit in 16 bits
+        # and the wrap-around of the negative weights cancels out.
+        rows = stack[:, :, self.x1] * self.qwx
+        rows += stack[:, :, self.x2] * self.qdx
+        rows += 1 << 14
+        # Interpolate in the y-direction in int32, then round the Q14 result to the nearest level.
+        new_stack = rows[:, self.y1[start:stop] - first].astype(np.int32)
+        new_stack -= 1 << 14
+        new_stack *= self.qwy[start:stop]
+        bottom = rows[:, self.y2[start:stop] - first].astype(np.int32)
+        bottom -= 1 << 14
+        new_stack += bottom * self.qdy[start:stop]
+        new_stack += 1 << 13
+        new_stack >>= 14
+
+        # Clip the result to the 0-255 range.
+        return np.clip(new_stack, 0, 255).astype(np.uint8)
+
+    def _area(self, stack, start, stop, first):
+        if self.blocks is not None:
+            fy, fx = self.blocks
+            return stack.reshape(stack.shape[0], stop - start, fy, self.new_shape[1], fx, -1).mean(axis=(2, 4))
+
+        # Average the covered columns of every source row, then the covered rows of the result.
+        rows = _area_axis(stack, self.kx, self.fx, self.sx, axis=2)
+        ky = self.ky[start:stop + 1] - first
+        return _area_axis(rows, ky, self.fy[start:stop + 1], self.sy, axis=1)
+
+
+def _area_axis(stack, k, f, scale, axis):
+    """Averages the source intervals of one axis given by the tables of area_coordinates.
+    :param stack: The images arranged as (N, H, W, C).
+    :param k: The source pixels containing the interval edges, relative to the first row of the stack.
+    :param f: The fractions of those pixels before the edges, shaped to broadcast along the axis.
+    :param scale: The interval length.
+    :param axis: The axis to average, 1 for rows or 2 for columns.
+    :return: The averaged images.
+    """
+    # Sum the whole pixels of every interval [k_i, k_i+1). Each sum only depends on the
+    # pixels of its own interval, so a band of rows yields the same values as the whole image.
+    sums = np.add.reduceat(stack, k, axis=axis)
+    sums = np.delete(sums, -1, axis=axis)
+    empty = k[:-1] == k[1:]
+    if empty.any():
+        # Upscaled intervals can lie inside a single pixel, where reduceat returns that pixel.
+        sums[(slice(None),) * axis + (empty,)] = 0
+
+    # Remove the part of the first pixel before the interval and add the part of the last one.
+    edges = np.take(stack, k, axis=axis) * f
+    return (sums - np.delete(edges, -1, axis=axis) + np.delete(edges, 0, axis=axis)) / scale
+
+
+@functools.lru_cache(maxsize=32)
+def resize_plan(old_shape, new_shape, method='bilinear'):
+    """Returns the cached plan of a resize, building it on the first request.
+    :param old_shape: The shape (height, width) of the input images.
+    :param new_shape: The shape (height, width) of the output images.
+    :param method: The interpolation method, 'bilinear' or 'area'.
+    :return: The ResizePlan of the geometry.
+    """
+    return ResizePlan(old_shape, new_shape, method)
+
+
+def resize(image, new_width, new_height, method='bilinear', batch=False, preserve_dtype=False):
+    """Resizes an image, a color image or a batch of them with a cached plan.
+    :param image: The input image of shape (H, W), (H, W, C), (N, H, W) or (N, H, W, C).
+    :param new_width: The width of the scaled output image.
+    :param new_height: The height of the scaled output image.
+    :param method: The interpolation method, 'bilinear' or 'area'.
+    :param batch: Whether a three-dimensional image is a batch (N, H, W) rather than (H, W, C).
+    :param preserve_dtype: Whether an 8-bit image is resized to a rounded 8-bit image in fixed point.
+    :return: The scaled image (NumPy array) with the same layout as the input.
+    """
+    shape = np.shape(image)
+    axis = spatial_axis(shape, batch)
+    # Repeated resizes of the same geometry reuse the cached index and weight tables.
+    plan = resize_plan(shape[axis:axis + 2], (int(new_height), int(new_width)), method)
+    return plan.apply(image, batch, preserve_dtype)
+
+
+def bilinear_interpolation(image, new_width, new_height, batch=False, preserve_dtype=False):
+    """Performs image scaling using bilinear interpolation.
+    :param image: The input image before scaling, of shape (H, W), (H, W, C), (N, H, W) or (N, H, W, C).
+    :param new_width: The width of the scaled output image.
+    :param new_height: The height of the scaled output image.
+    :param batch: Whether a three-dimensional image is a batch (N, H, W) rather than (H, W, C).
+    :param preserve_dtype: Whether an 8-bit image is resized to a rounded 8-bit image in fixed point.
+    :return: The scaled image (NumPy array).
+    """
+    return resize(image, new_width, new_height, 'bilinear', batch, preserve_dtype)
+
+
+def area_interpolation(image, new_width, new_height, batch=False, preserve_dtype=False):
+    """Performs image scaling by averaging the source area covered by every output pixel.
+    :param image: The input image before scaling, of shape (H, W), (H, W, C), (N, H, W) or (N, H, W, C).
+    :param new_width: The width of the scaled output image.
+    :param new_height: The height of the scaled output image.
+    :param batch: Whether a three-dimensional image is a batch (N, H, W) rather than (H, W, C).
+    :param preserve_dtype: Whether an 8-bit image is resized to a rounded 8-bit image in fixed point.
+    :return: The scaled image (NumPy array).
+    """
+    return resize(image, new_width, new_height, 'area', batch, preserve_dtype)
+
+
+def pyramid(image, levels=None, batch=False):
+    """Builds an image pyramid by repeatedly halving the image with area averaging.
+    :param image: The input image, the first level of the pyramid, of shape (H, W), (H, W, C),
+                  (N, H, W) or (N, H, W, C).
+    :param levels: The number of levels, or None to halve until a side reaches 1 pixel.
+    :param batch: Whether a three-dimensional image is a batch (N, H, W) rather than (H, W, C).
+    :return: A list of the pyramid levels (NumPy arrays), from the input to the smallest.
+    """
+    result = [np.asarray(image, dtype=np.float64)]
+    axis = spatial_axis(result[0].shape, batch)
+    while len(result) != levels and min(result[-1].shape[axis:axis + 2]) > 1:
+        height, width = result[-1].shape[axis:axis + 2]
+        # An odd side averages 2.x source pixels per output pixel with segment sums along each axis,
+        # while a level with both sides even reduces whole 2x2 blocks with a reshape.
+        result.append(area_interpolation(result[-1], width // 2, height // 2, batch))
+    return result
+
+
+def open_bmp(path, mode='r'):
+    """Maps the pixel data of an uncompressed 8-bit or 24-bit BMP file into memory without reading it.
+    :param path: The path of the BMP file.
+    :param mode: The np.memmap mode, 'r' for read-only or 'r+' to write into the file.
+    :return: A memory-mapped view of shape (H, W) of palette indices, or (H, W, 3) in BGR order,
+             with the top row first.
+    """
+    with open(path, 'rb') as file:
+        header = file.read(54)
+    if header[:2] != b'BM':
+        raise ValueError(f'{path} is not a BMP file.')
+    offset, = struct.unpack_from('<I', header, 10)
+    width, height, _, bits, compression = struct.unpack_from('<iiHHI', header, 18)
+    if bits not in (8, 24) or compression != 0:
+        raise ValueError(f'Only uncompressed 8-bit and 24-bit BMP files are supported, not {bits}-bit.')
+
+    # Every row is padded to a multiple of 4 bytes.
+    channels = bits // 8
+    stride = (width * channels + 3) // 4 * 4
+    data = np.memmap(path, dtype=np.uint8, mode=mode, offset=offset, shape=(abs(height), stride))
+    pixels = data[:, :width * channels].reshape((abs(height), width, channels)[:3 if channels == 3 else 2])
+    # A positive height stores the rows bottom-up.
+    return pixels[::-1] if height > 0 else pixels
+
+
+def create_bmp(path, width, height, channels=1):
+    """Creates an uncompressed BMP file filled with zeros and maps its pixel data into memory.
+    :param path: The path of the new BMP file.
+    :param width: The width of the image.
+    :param height: The height of the image.
+    :param channels: 1 for an 8-bit grayscale image or 3 for a 24-bit BGR image.
+    :return: A writable memory-mapped view of the pixels as returned by open_bmp.
+    """
+    if channels not in (1, 3):
+        raise ValueError('A BMP file has 1 (grayscale) or 3 (BGR) channels.')
+    stride = (width * channels + 3) // 4 * 4
+    # Grayscale images carry a palette that maps every index to the same gray level.
+    palette = np.repeat(np.arange(256, dtype=np.uint8), 4).tobytes() if channels == 1 else b''
+    offset = 54 + len(palette)
+    size = offset + stride * height
+
+    with open(path, 'wb') as file:
+        file.write(struct.pack('<2sIHHI', b'BM', size, 0, 0, offset))
+        file.write(struct.pack('<IiiHHIIiiII', 40, width, height, 1, 8 * channels, 0, stride * height,
+                               2835, 2835, 256 if channels == 1 else 0, 0))
+        file.write(palette)
+        file.truncate(size)
+    return open_bmp(path, 'r+')
+
+
+def resize_tiled(source, destination, method='bilinear', band=64, batch=False, preserve_dtype=False):
+    """Resizes an image band by band, so that only a band of source and output rows is held in memory.
+    :param source: The input image, typically a memory-mapped array such as one from open_bmp,
+                   of shape (H, W), (H, W, C), (N, H, W) or (N, H, W, C).
+    :param destination: The preallocated output with the same layout, typically a memory-mapped
+                        array such as one from create_bmp. Values are truncated to its dtype.
+    :param method: The interpolation method, 'bilinear' or 'area'.
+    :param band: The number of output rows computed at a time.
+    :param batch: Whether a three-dimensional image is a batch (N, H, W) rather than (H, W, C).
+    :param preserve_dtype: Whether an 8-bit source is resized in fixed point and rounded to the nearest level.
+    :return: The destination.
+    """
+    axis = spatial_axis(np.shape(source), batch)
+    plan = resize_plan(np.shape(source)[axis:axis + 2], np.shape(destination)[axis:axis + 2], method)
+    for start in range(0, plan.new_shape[0], band):
+        stop = min(start + band, plan.new_shape[0])
+        # Each band reads its source rows plus the halo rows that the band boundary cuts through.
+        destination[(slice(None),) * axis + (slice(start, stop),)] = plan.apply_rows(source, start, stop, batch, preserve_dtype)
+    return destination
@@ -0,0 +1,185 @@
+"""
+Copyright (C) 2025 Fu Tszkok
+
+:module: Project 02-04 (Benchmark)
+:function: Timing comparison between the loop-based and the vectorized bilinear interpolation,
+           between rebuilt and cached resize plans, of the area-averaging shrink, of the tiled resize
+           and of the 8-bit fixed-point resize
+:author: Fu Tszkok
+:date: 2025-01-28
+:license: AGPLv3 + Additional Restrictions (Non-Commercial Use)
+
+This code is licensed under GNU Affero General Public License v3 (AGPLv3) with additional terms.
+- Commercial use prohibited (including but not limited to sale, integration into commercial products)
+- Academic use requires clear attribution in code comments or documentation
+
+Full AGPLv3 text available in LICENSE file or at <https://www.gnu.org/licenses/agpl-3.0.html>
+"""
+
+import os
+import time
+import tempfile
+import tracemalloc
+import bilinear
+import cv2 as cv
+import numpy as np
+
+
+def bilinear_interpolation_loop(image, new_width, new_height):
+    """The original per-pixel implementation of bilinear_interpolation, kept as the reference for timing.
+    :param image: The input image before scaling.
+    :param new_width: The width of the scaled output image.
+    :param new_height: The height of the scaled output image.
+    :return: The scaled image (NumPy array).
+    """
+    image = np.array(image, dtype=np.float64)
+    old_height, old_width = image.shape
+    new_image = np.zeros((new_height, new_width), dtype=np.float64)
+
+    scale_x = old_width / new_width
+    scale_y = old_height / new_height
+
+    for y in range(new_height):
+        for x in range(new_width):
+            src_x = (x + 0.5) * scale_x - 0.5
+            src_y = (y + 0.5) * scale_y - 0.5
+
+            x1 = int(src_x)
+            y1 = int(src_y)
+            x2 = min(x1 + 1, old_width - 1)
+            y2 = min(y1 + 1, old_height - 1)
+
+            dx = src_x - x1
+            dy = src_y - y1
+
+            top_left = image[y1, x1] * (1 - dx) + image[y1, x2] * dx
+            bottom_left = image[y2, x1] * (1 - dx) + image[y2, x2] * dx
+            final_value = top_left * (1 - dy) + bottom_left * dy
+
+            new_image[y, x] = np.clip(final_value, 0, 255)
+
+    return new_image
+
+
+def timing(func, *args, repeat=3):
+    """Measures the best wall time of several calls to a function.
+    :param func: The function to be timed.
+    :param args: Positional arguments passed to the function.
+    :param repeat: Number of calls; the fastest one is reported.
+    :return: A tuple containing the best time in seconds and the last return value.
+    """
+    best, value = np.inf, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, value
+
+
+# Load the original image and the 256x256 version that is scaled back up.
+image = cv.imread('../../images/rose1024.bmp', cv.IMREAD_GRAYSCALE)
+small = np.uint8(bilinear.bilinear_interpolation(image, 256, 256))
+
+# Byte-compatible means that the float results are identical, not only the 8-bit images.
+print(f'{"Resize":>22} | {"Loop (s)":>10} | {"Vectorized (s)":>14} | {"Speedup":>8} | {"Identical":>9}')
+for source, (width, height) in [(image, (256, 256)), (image, (700, 500)), (small, (512, 512)), (small, (1024, 1024))]:
+    # The reference is only run once since it dominates the total running time.
+    loop_time, loop_result = timing(bilinear_interpolation_loop, source, width, height, repeat=1)
+    vec_time, vec_result = timing(bilinear.bilinear_interpolation, source, width, height)
+
+    label = f'{source.shape[1]}x{source.shape[0]} -> {width}x{height}'
+    identical = np.array_equal(loop_result, vec_result)
+    print(f'{label:>22} | {loop_time:>10.4f} | {vec_time:>14.4f} | {loop_time / vec_time:>7.1f}x | {str(identical):>9}')
+
+# Compare resizing a stack of frames with tables rebuilt for every frame against one cached plan.
+frames = np.array([np.roll(small, k, axis=1) for k in range(64)])
+print()
+print(f'{"Resize":>22} | {"Rebuilt (ms/frame)":>18} | {"Cached (ms/frame)":>17} | {"Speedup":>8} | {"Identical":>9}')
+for source, (height, width) in [(frames, (512, 512)), (frames, (1024, 1024)), (frames, (100, 60))]:
+    old_shape = source.shape[1:]
+    rebuilt = lambda x: [bilinear.ResizePlan(old_shape, (height, width)).apply(frame) for frame in x]
+    cached = lambda x: [bilinear.resize_plan(old_shape, (height, width)).apply(frame) for frame in x]
+    rebuilt_time, rebuilt_result = timing(rebuilt, source)
+    cached_time, cached_result = timing(cached, source)
+
+    label = f'{old_shape[1]}x{old_shape[0]} -> {width}x{height}'
+    identical = np.array_equal(rebuilt_result, cached_result)
+    rebuilt_time, cached_time = rebuilt_time / len(source) * 1000, cached_time / len(source) * 1000
+    print(f'{label:>22} | {rebuilt_time:>18.3f} | {cached_time:>17.3f} | {rebuilt_time / cached_time:>7.2f}x | {str(identical):>9}')
+
+# Compare large shrinks by bilinear interpolation, area averaging and a pyramid of halvings. The error
+# is measured against OpenCV's area interpolation, which averages every covered source pixel.
+print()
+print(f'{"Resize":>22} | {"Bilinear (s)":>12} | {"Area (s)":>10} | {"Pyramid (s)":>11} | {"Bilinear err":>12} | {"Area err":>10}')
+for width, height in [(512, 512), (256, 256), (128, 128), (300, 200)]:
+    bilinear.resize_plan.cache_clear()
+    bilinear_time, bilinear_result = timing(bilinear.bilinear_interpolation, image, width, height)
+    area_time, area_result = timing(bilinear.area_interpolation, image, width, height)
+    pyramid_time, _ = timing(bilinear.pyramid, image, int(np.log2(1024 // width)) + 1)
+
+    reference = cv.resize(np.float64(image), (width, height), interpolation=cv.INTER_AREA)
+    bilinear_error = np.mean(np.abs(bilinear_result - reference))
+    area_error = np.mean(np.abs(area_result - reference))
+    label = f'1024x1024 -> {width}x{height}'
+    print(f'{label:>22} | {bilinear_time:>12.4f} | {area_time:>10.4f} | {pyramid_time:>11.4f} | {bilinear_error:>12.2e} | {area_error:>10.2e}')
+
+# The largest deviation of the area shrink from OpenCV. For float64 input both sides differ only by
+# the order of the double-precision sums, while OpenCV resizes float32 input in single precision,
+# which leaves float32 rounding errors of up to a few 1e-5 on the 0-255 scale.
+print()
+print(f'{"Resize":>22} | {"Max err (float64)":>17} | {"Max err (float32)":>17}')
+for width, height in [(512, 512), (300, 200), (700, 613), (100, 77)]:
+    area_result = bilinear.area_interpolation(image, width, height)
+    errors = [np.max(np.abs(area_result - cv.resize(dtype(image), (width, height), interpolation=cv.INTER_AREA)))
+              for dtype in (np.float64, np.float32)]
+    label = f'1024x1024 -> {width}x{height}'
+    print(f'{label:>22} | {errors[0]:>17.2e} | {errors[1]:>17.2e}')
+
+# Compare resizing a 4096x4096 color scene stored as a BMP file as a whole with the tiled resize
+# that streams bands of rows from the memory-mapped file into a memory-mapped BMP destination.
+directory = tempfile.mkdtemp()
+scene = bilinear.create_bmp(os.path.join(directory, 'scene.bmp'), 4096, 4096, 3)
+color = cv.imread('../../images/rose1024.bmp', cv.IMREAD_COLOR)
+for k in range(4):
+    scene[1024 * k:1024 * (k + 1)] = np.tile(np.roll(color, 256 * k, axis=1), (1, 4, 1))
+scene.flush()
+del scene
+print()
+print(f'{"Resize":>24} | {"Whole (s)":>9} | {"Tiled (s)":>9} | {"Whole (MB)":>10} | {"Tiled (MB)":>10} | {"Identical":>9}')
+for method, (width, height) in [('area', (1024, 1024)), ('area', (1500, 1500)), ('bilinear', (2048, 2048)), ('bilinear', (5000, 5000))]:
+    source = bilinear.open_bmp(os.path.join(directory, 'scene.bmp'))
+    whole = lambda: np.uint8(bilinear.resize(np.asarray(source), width, height, method))
+    tiled = lambda: bilinear.resize_tiled(source, bilinear.create_bmp(os.path.join(directory, 'out.bmp'), width, height, 3), method)
+    times, memory, results = [], [], []
+    for run in [whole, tiled]:
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = run()
+        times.append(time.perf_counter() - start)
+        memory.append(tracemalloc.get_traced_memory()[1] / 2 ** 20)
+        tracemalloc.stop()
+        results.append(np.array(result))
+
+    label = f'{method} 4096 -> {width}'
+    identical = np.array_equal(results[0], results[1])
+    print(f'{label:>24} | {times[0]:>9.3f} | {times[1]:>9.3f} | {memory[0]:>10.1f} | {memory[1]:>10.1f} | {str(identical):>9}')
+
+# Compare the float path, whose result is cast back to 8 bits, with the 8-bit fixed-point path. The error
+# is measured against the float result rounded to the nearest level, which the fixed-point path targets.
+print()
+print(f'{"Resize":>22} | {"Float (s)":>9} | {"Fixed (s)":>9} | {"Float (MB)":>10} | {"Fixed (MB)":>10} | {"Max err":>7} | {"Mean err":>8}')
+for source, (width, height) in [(image, (256, 256)), (image, (700, 500)), (small, (1024, 1024)), (color, (2048, 2048))]:
+    float_path = lambda: np.uint8(bilinear.bilinear_interpolation(source, width, height))
+    fixed_path = lambda: bilinear.bilinear_interpolation(source, width, height, preserve_dtype=True)
+    times, memory = [], []
+    for run in [float_path, fixed_path]:
+        times.append(timing(run)[0])
+        tracemalloc.start()
+        run()
+        memory.append(tracemalloc.get_traced_memory()[1] / 2 ** 20)
+        tracemalloc.stop()
+
+    reference = np.rint(bilinear.bilinear_interpolation(source, width, height))
+    error = np.abs(fixed_path() - reference)
+    label = f'{source.shape[1]}x{source.shape[0]} -> {width}x{height}'
+    print(f'{label:>22} | {times[0]:>9.4f} | {times[1]:>9.4f} | {memory[0]:>10.1f} | {memory[1]:>10.1f} | {error.max():>7.0f} | {error.mean():>8.4f}')
@@ -0,0 +1,97 @@
+"""
+Copyright (C) 2025 Fu Tszkok
+
+:module: Project 03-01 (Benchmark)
+:function: Timing of the per-pixel intensity transformations against cached lookup tables,
+           and of composed lookup tables against applying the transformations in turn
+:author: Fu Tszkok
+:date: 2025-02-01
+:license: AGPLv3 + Additional Restrictions (Non-Commercial Use)
+
+This code is licensed under GNU Affero General Public License v3 (AGPLv3) with additional terms.
+- Commercial use prohibited (including but not limited to sale, integration into commercial products)
+- Academic use requires clear attribution in code comments or documentation
+
+Full AGPLv3 text available in LICENSE file or at <https://www.gnu.org/licenses/agpl-3.0.html>
+"""
+
+import math
+import time
+import intensity
+import cv2 as cv
+import numpy as np
+
+
+def transform_loop(image, function):
+    """
+    The original per-pixel implementation of the transformations, kept as the reference for timing.
+    :param image: Input grayscale image (NumPy array) normalized to the range [0, 1].
+    :param function: The scalar transformation of a normalized gray level.
+    :return: The transformed image (NumPy array).
+    """
+    result = np.zeros((image.shape[0], image.shape[1]))
+    for i in range(image.shape[0]):
+        for j in range(image.shape[1]):
+            result[i, j] = function(image[i, j])
+    return result
+
+
+def timing(func, *args, repeat=3):
+    """
+    Measures the best wall time of several calls to a function.
+    :param func: The function to be timed.
+    :param args: Positional arguments passed to the function.
+    :param repeat: Number of calls; the fastest one is reported.
+    :return: A tuple containing the best time in seconds and the last return value.
+    """
+    best, value = np.inf, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, value
+
+
+image = cv.imread('../../images/spine.bmp', cv.IMREAD_GRAYSCALE)
+normalized = np.float64(image) / 255.0
+steps = [('log', c) for c in [1, 2.5, 5]] + [('power', c, gamma) for c in [0.8, 1, 1.5] for gamma in [1.5, 0.6, 0.4]]
+
+# The 12 transformations of the project: the loop, the first call that builds the table,
+# and later calls that reuse the cached table.
+print(f'{"Transformation":>20} | {"Loop (s)":>9} | {"Build (ms)":>10} | {"Cached (ms)":>11} | {"Speedup":>8} | {"Identical":>9}')
+intensity.lookup_table.cache_clear()
+for step in steps:
+    name, *parameters = step
+    function = lambda r: intensity.transforms[name](r, *parameters)
+    # The reference is only run once since it dominates the total running time.
+    loop, reference = timing(transform_loop, normalized, function, repeat=1)
+    build, _ = timing(intensity.transform, image, *step, repeat=1)
+    cached, result = timing(intensity.transform, image, *step)
+    label = f'{name}{tuple(parameters)}'
+    identical = np.array_equal(reference, result)
+    print(f'{label:>20} | {loop:>9.3f} | {build * 1e3:>10.3f} | {cached * 1e3:>11.3f} | {loop / cached:>8.0f} | {identical!s:>9}')
+
+
+def sequential(image, steps):
+    """
+    Applies transformations one after another on the floating-point image.
+    :param image: Input grayscale image (NumPy array of uint8).
+    :param steps: Tuples (name, *parameters), applied from first to last.
+    :return: The transformed image (NumPy array).
+    """
+    result = np.float64(image) / 255.0
+    for name, *parameters in steps:
+        function = np.vectorize(lambda r: intensity.transforms[name](r, *parameters))
+        result = function(result)
+    return result
+
+
+# Chains of transformations, applied in turn to the whole image or composed into one table.
+print()
+print(f'{"Steps":>5} | {"Sequential (s)":>14} | {"Composed (ms)":>13} | {"Identical":>9}')
+chains = [steps[:1], [('log', 1), ('power', 1, 0.4)], [('negative',), ('power', 1, 0.6), ('log', 2.5), ('negative',)]]
+for chain in chains:
+    loop, reference = timing(sequential, image, chain, repeat=1)
+    composed, result = timing(intensity.transform, image, *chain)
+    identical = np.array_equal(reference, result)
+    print(f'{len(chain):>5} | {loop:>14.3f} | {composed * 1e3:>13.3f} | {identical!s:>9}')
@@ -14,18 +14,16 @@ This code is licensed under GNU Affero General Public License v3 (AGPLv3) with a
 Full AGPLv3 text available in LICENSE file or at <https://www.gnu.org/licenses/agpl-3.0.html>
 """
 
-import math
+import intensity
 import cv2 as cv
-import numpy as np
 import matplotlib.pyplot as plt
 
-# Load a grayscale image and normalize pixel values to the range [0, 1].
+# Load a grayscale image. The transformations work on pixel values normalized to the range [0, 1].
 image = cv.imread('../../images/spine.bmp', cv.IMREAD_GRAYSCALE)
-image = np.float64(image) / 255.0
 
 # Display the original image
 plt.axis('off')
-plt.imshow(image, cmap='gray', vmin=0, vmax=1)
+plt.imshow(image, cmap='gray', vmin=0, vmax=255)
 plt.title("Original Image")
 plt.show()
 
@@ -35,12 +33,8 @@ C = [1, 2.5, 5]
 
 # Iterate through different 'c' values to apply the transformation.
 for c in C:
-    # Initialize a new image array for the result.
-    result = np.zeros((image.shape[0], image.shape[1]))
-    # Apply the logarithmic transformation to each pixel: s = c * log(1 + r).
-    for i in range(image.shape[0]):
-        for j in range(image.shape[1]):
-            result[i, j] = c * math.log(1 + image[i, j])
+    # Apply the logarithmic transformation s = c * log(1 + r) through its lookup table.
+    result = intensity.transform(image, 'log', c)
 
     # Display the transformed image.
     plt.axis('off')
@@ -56,15 +50,21 @@ Gamma = [1.5, 0.6, 0.4]
 # Iterate through different 'c' and 'gamma' values.
 for c in C:
     for gamma in Gamma:
-        # Initialize a new image array for the result.
-        result = np.zeros((image.shape[0], image.shape[1]))
-        # Apply the power-law transformation to each pixel: s = c * r^gamma.
-        for i in range(image.shape[0]):
-            for j in range(image.shape[1]):
-                result[i, j] = c * math.pow(image[i, j], gamma)
+        # Apply the power-law transformation s = c * r^gamma through its lookup table.
+        result = intensity.transform(image, 'power', c, gamma)
 
         # Display the transformed image.
         plt.axis('off')
         plt.imshow(result, cmap='gray', vmin=0, vmax=1)
         plt.title(f"c={c}, γ={gamma} Power-law Image")
         plt.show()
+
+
+# Compose a log transformation with a power-law transformation into a single lookup table.
+result = intensity.transform(image, ('log', 1), ('power', 1, 0.4))
+
+# Display the transformed image.
+plt.axis('off')
+plt.imshow(result, cmap='gray', vmin=0, vmax=1)
+plt.title("Composed Logarithmic and Power-law Image")
+plt.show()
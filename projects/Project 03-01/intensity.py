@@ -0,0 +1,113 @@
+"""
+Copyright (C) 2025 Fu Tszkok
+
+:module: intensity
+:function: The function package from Project 03-01 Image Enhancement Using Intensity Transformations
+:author: Fu Tszkok
+:date: 2025-02-01
+:license: AGPLv3 + Additional Restrictions (Non-Commercial Use)
+
+An 8-bit image has only 256 gray levels, so every intensity transformation is a 256-entry
+function. It is evaluated once into a lookup table and applied with a single indexed gather.
+
+This code is licensed under GNU Affero General Public License v3 (AGPLv3) with additional terms.
+- Commercial use prohibited (including but not limited to sale, integration into commercial products)
+- Academic use requires clear attribution in code comments or documentation
+
+Full AGPLv3 text available in LICENSE file or at <https://www.gnu.org/licenses/agpl-3.0.html>
+"""
+
+import math
+import functools
+import numpy as np
+
+
+def log_transform(r, c):
+    """
+    The logarithmic transformation s = c * log(1 + r).
+    :param r: The normalized input gray level from 0-1.
+    :param c: The scaling constant.
+    :return: The output gray level.
+    """
+    return c * math.log(1 + r)
+
+
+def power_transform(r, c, gamma):
+    """
+    The power-law transformation s = c * r^gamma.
+    :param r: The normalized input gray level from 0-1.
+    :param c: The scaling constant.
+    :param gamma: The exponent.
+    :return: The output gray level.
+    """
+    return c * math.pow(r, gamma)
+
+
+def negative_transform(r):
+    """
+    The image negative s = 1 - r.
+    :param r: The normalized input gray level from 0-1.
+    :return: The output gray level.
+    """
+    return 1 - r
+
+
+# The transformations known by name. Each one maps a normalized gray level and its
+# parameters to the output level, and further ones can be registered here.
+transforms = {
+    'log': log_transform,
+    'power': power_transform,
+    'negative': negative_transform,
+}
+
+
+@functools.lru_cache(maxsize=64)
+def lookup_table(*steps):
+    """
+    Builds the lookup table of a transformation, or of several transformations applied in turn.
+    The steps are composed on the 256 input levels, so the table holds f_n(...f_1(r)) exactly.
+    :param steps: Tuples (name, *parameters), applied from first to last, e.g. ('log', 2.5).
+    :return: The read-only 256-entry table (NumPy array of float64) over the levels r = 0/255 to 255/255.
+    """
+    if not steps:
+        raise ValueError('At least one transformation is required.')
+    for name, *_ in steps:
+        if name not in transforms:
+            raise ValueError(f'Unknown transformation {name!r}, expected one of {tuple(transforms)}.')
+
+    table = np.zeros(256)
+    for level in range(256):
+        value = level / 255.0
+        for name, *parameters in steps:
+            value = transforms[name](value, *parameters)
+        table[level] = value
+    # The table is shared by every caller through the cache.
+    table.flags.writeable = False
+    return table
+
+
+def apply(image, table, out=None):
+    """
+    Applies a lookup table to an 8-bit image with one indexed gather.
+    :param image: Input grayscale image (NumPy array of uint8).
+    :param table: The 256-entry lookup table.
+    :param out: An optional array receiving the result.
+    :return: The transformed image (NumPy array of the table's type).
+    """
+    if image.dtype != np.uint8:
+        raise ValueError(f'Lookup tables need an 8-bit image, got {image.dtype}.')
+    return np.take(table, image, out=out)
+
+
+def transform(image, *steps):
+    """
+    Applies one transformation, or the composition of several, to an 8-bit image.
+    :param image: Input grayscale image (NumPy array of uint8).
+    :param steps: A transformation name followed by its parameters, e.g. ('power', 0.8, 1.5),
+                  or several tuples (name, *parameters) applied from first to last.
+    :return: The transformed image (NumPy array of float64).
+    """
+    # A single transformation may be given without wrapping it into a tuple.
+    if steps and isinstance(steps[0], str):
+        steps = (tuple(steps),)
+    return apply(image, lookup_table(*steps))
@@ -0,0 +1,149 @@
+"""
+Copyright (C) 2025 Fu Tszkok
+
+:module: Project 03-02 (Benchmark)
+:function: Timing of the 256-pass histogram against the single-pass bincount histogram
+           for 8-bit, 16-bit, float and color images, of the loop-based equalization
+           against the cumsum and lookup-table equalization, and of CLAHE against OpenCV's
+:author: Fu Tszkok
+:date: 2025-01-28
+:license: AGPLv3 + Additional Restrictions (Non-Commercial Use)
+
+This code is licensed under GNU Affero General Public License v3 (AGPLv3) with additional terms.
+- Commercial use prohibited (including but not limited to sale, integration into commercial products)
+- Academic use requires clear attribution in code comments or documentation
+
+Full AGPLv3 text available in LICENSE file or at <https://www.gnu.org/licenses/agpl-3.0.html>
+"""
+
+import copy
+import time
+import histogram
+import cv2 as cv
+import numpy as np
+
+
+def histogram_loop(image):
+    """
+    The original implementation of the histogram, which scans the image once per gray level.
+    :param image: Input grayscale image (NumPy array).
+    :return: A tuple containing the counts of each grayscale level and the levels themselves.
+    """
+    x = [i for i in range(256)]
+    count = np.zeros(256)
+    for i in range(256):
+        count[i] = np.sum(image == i)
+    return count, x
+
+
+def equalization_loop(image):
+    """
+    The original implementation of the equalization, with the quadratic CDF loop and one masked
+    assignment per gray level, kept as the reference for timing. The plotting is left out.
+    :param image: Input grayscale image (NumPy array).
+    :return: A tuple containing the equalized image (NumPy array) and the transformation function.
+    """
+    row, col = image.shape
+    count, x = histogram_loop(image)
+    count = np.double(count) / (row * col)
+    equal = np.zeros(256)
+    for i in range(256):
+        for j in range(i + 1):
+            equal[i] += count[j]
+    equal = np.round(equal * 255)
+    trans = np.zeros(256)
+    diff = int(np.max(equal) - np.min(equal))
+    for i in range(256):
+        trans[i] = (equal[i] - np.min(equal)) * 255 / diff
+    result = copy.deepcopy(image)
+    for i in range(256):
+        result[image == i] = trans[i]
+    return result, trans
+
+
+def timing(func, *args, repeat=5, **kwargs):
+    """
+    Measures the best wall time of several calls to a function.
+    :param func: The function to be timed.
+    :param args: Positional arguments passed to the function.
+    :param repeat: Number of calls; the fastest one is reported.
+    :param kwargs: Keyword arguments passed to the function.
+    :return: A tuple containing the best time in seconds and the last return value.
+    """
+    best, value = np.inf, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best, value
+
+
+# Gray-level histograms of the project images and of a 4096x4096 image, which is 8-bit, 16-bit or float.
+spine = cv.imread('../../images/spine.bmp', cv.IMREAD_GRAYSCALE)
+large = cv.resize(spine, (4096, 4096), interpolation=cv.INTER_LINEAR)
+images = {
+    'spine uint8': spine,
+    '4096^2 uint8': large,
+    '4096^2 uint16': np.uint16(large) * 257,
+    '4096^2 float': np.float64(large),
+}
+print(f'{"Image":>14} | {"Loop (ms)":>10} | {"Bincount (ms)":>13} | {"np.histogram (ms)":>17} | {"Speedup":>8} | {"Identical":>9}')
+for name, image in images.items():
+    loop, (reference, _) = timing(histogram_loop, image, repeat=1)
+    single, (count, _) = timing(histogram.histogram, image)
+    numpy, _ = timing(np.histogram, image, 256, (0, 256))
+    identical = np.array_equal(reference, count)
+    print(f'{name:>14} | {loop * 1e3:>10.2f} | {single * 1e3:>13.2f} | {numpy * 1e3:>17.2f} | {loop / single:>8.0f} | {identical!s:>9}')
+
+# The full 16-bit histogram, and float images binned over a value range.
+print()
+print(f'{"Image":>14} | {"Bins":>6} | {"Bincount (ms)":>13} | {"np.histogram (ms)":>17} | {"Identical":>9}')
+cases = [('4096^2 uint16', images['4096^2 uint16'], 65536, (0, 65536)),
+         ('4096^2 float', images['4096^2 float'] / 255, 64, (0, 1)),
+         ('4096^2 uint8', images['4096^2 uint8'], 32, (-1, 255))]
+for name, image, bins, value_range in cases:
+    if image.dtype == np.uint16:
+        single, (count, _) = timing(histogram.histogram, image, bins)
+    else:
+        single, (count, _) = timing(histogram.histogram, image, bins, value_range)
+    numpy, (reference, _) = timing(np.histogram, image, bins, value_range)
+    identical = np.array_equal(reference, count)
+    print(f'{name:>14} | {bins:>6} | {single * 1e3:>13.2f} | {numpy * 1e3:>17.2f} | {identical!s:>9}')
+
+# The per-channel histograms of a color image, one loop call per channel or a single call.
+color = cv.imread('../../images/bottom_left_stream.bmp')
+print()
+print(f'{"Image":>14} | {"Loop x3 (ms)":>12} | {"One call (ms)":>13} | {"Masked (ms)":>11} | {"Identical":>9}')
+loop, references = timing(lambda: [histogram_loop(color[:, :, k])[0] for k in range(3)], repeat=1)
+single, (counts, _) = timing(histogram.histogram, color, channels=True)
+mask = color.sum(axis=2) > 0
+masked, _ = timing(histogram.histogram, color, mask=mask, channels=True)
+identical = np.array_equal(np.array(references), counts)
+label = f'{color.shape[0]}x{color.shape[1]}x3'
+print(f'{label:>14} | {loop * 1e3:>12.2f} | {single * 1e3:>13.2f} | {masked * 1e3:>11.2f} | {identical!s:>9}')
+
+# Equalization of the project image, of the 4096x4096 image and of a float image, which only has its
+# integer levels mapped. OpenCV only equalizes 8-bit images.
+print()
+print(f'{"Image":>14} | {"Loop (ms)":>10} | {"Cumsum (ms)":>11} | {"cv (ms)":>8} | {"Speedup":>8} | {"Identical":>9}')
+for name, image in [('spine uint8', spine), ('4096^2 uint8', large), ('spine float', np.float64(spine))]:
+    loop, (reference, _) = timing(equalization_loop, image, repeat=1)
+    single, (result, _) = timing(histogram.equalization, image)
+    opencv = timing(cv.equalizeHist, image)[0] * 1e3 if image.dtype == np.uint8 else np.nan
+    identical = reference.dtype == result.dtype and np.array_equal(reference, result)
+    print(f'{name:>14} | {loop * 1e3:>10.2f} | {single * 1e3:>11.2f} | {opencv:>8.2f} | {loop / single:>8.0f} | {identical!s:>9}')
+
+# CLAHE of the low-contrast scans against OpenCV, which it matches pixel for pixel.
+print()
+print(f'{"Image":>14} | {"Clip":>4} | {"Tiles":>6} | {"CLAHE (ms)":>10} | {"cv (ms)":>8} | {"Max diff":>8}')
+for name in ['spine', 'phobos']:
+    image = cv.imread(f'../../images/{name}.bmp', cv.IMREAD_GRAYSCALE)
+    if image is None:
+        print(f'{name:>14} | not found in images/')
+        continue
+    for clip_limit, tiles in [(2.0, (8, 8)), (4.0, (8, 8)), (2.0, (16, 16))]:
+        single, result = timing(histogram.clahe, image, clip_limit, tiles)
+        opencv, reference = timing(cv.createCLAHE(clip_limit, tiles).apply, image)
+        difference = np.abs(np.int16(result) - reference).max()
+        label = f'{tiles[0]}x{tiles[1]}'
+        print(f'{name:>14} | {clip_limit:>4} | {label:>6} | {single * 1e3:>10.2f} | {opencv * 1e3:>8.2f} | {difference:>8}')
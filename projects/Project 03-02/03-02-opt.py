@@ -14,62 +14,12 @@ This code is licensed under GNU Affero General Public License v3 (AGPLv3) with a
 Full AGPLv3 text available in LICENSE file or at <https://www.gnu.org/licenses/agpl-3.0.html>
 """
 
-import copy
+from histogram import histogram, equalization, plot_transformation
 import cv2 as cv
 import numpy as np
 import matplotlib.pyplot as plt
 
 
-def histogram(image):
-    """Calculates the histogram of a grayscale image.
-    :param image: Input grayscale image (NumPy array).
-    :return: A tuple containing the counts of each grayscale level and the levels themselves.
-    """
-    x = [i for i in range(256)]  # Create a list of grayscale levels from 0 to 255.
-    count = np.zeros(256)  # Initialize an array to store the counts of each level.
-    for i in range(256):
-        count[i] = np.sum(image == i)  # Count the number of pixels with value 'i'.
-    return count, x
-
-
-def equalization(image):
-    """Performs histogram equalization on a grayscale image.
-    :param image: Input grayscale image (NumPy array).
-    :return: The equalized image (NumPy array).
-    """
-    row, col = image.shape
-    count, x = histogram(image)  # Get the histogram of the original image.
-    count = np.double(count) / (row * col)  # Normalize the histogram to get the probability of each level.
-
-    # Calculate the cumulative distribution function (CDF).
-    equal = np.zeros(256)
-    for i in range(256):
-        for j in range(i + 1):
-            equal[i] += count[j]
-
-    # Scale the CDF to the range [0, 255].
-    equal = np.round(equal * 255)
-
-    # Re-scale the transformation function to span the full range [0, 255].
-    trans = np.zeros(256)
-    diff = int(np.max(equal) - np.min(equal))
-    for i in range(256):
-        trans[i] = (equal[i] - np.min(equal)) * 255 / diff
-
-    # Plot the histogram equalization transformation function.
-    plt.plot(x, trans, '-', color='blue')
-    plt.xlim([0, 255])
-    plt.ylim([0, 255])
-    plt.title('Histogram Equalization Transformation Function')
-    plt.show()
-
-    # Apply the transformation function to the image.
-    result = copy.deepcopy(image)
-    for i in range(256):
-        result[image == i] = trans[i]
-    return result
-
-
 # Load image and compute its histogram.
 image = cv.imread('../../images/phobos.bmp', cv.IMREAD_GRAYSCALE)
 count, x = histogram(image)
@@ -90,7 +40,8 @@ plt.title('Histogram (ravel)')
 plt.show()
 
 # Perform histogram equalization using the custom function and OpenCV's built-in function.
-result = equalization(image)
+result, trans = equalization(image)
+plot_transformation(trans)
 [eq_count, eq_x] = histogram(result)
 real = cv.equalizeHist(image)
 [rcount, rx] = histogram(real)
@@ -0,0 +1,178 @@
+"""
+Copyright (C) 2025 Fu Tszkok
+
+:module: Project 04-01 (Benchmark)
+:function: Timing comparison between the loop-based, vectorized, real-input, batched and in-place fft2d,
+           the memory held by archived spectra and the scaling of the multi-threaded FFT backend
+:author: Fu Tszkok
+:date: 2025-02-01
+:license: AGPLv3 + Additional Restrictions (Non-Commercial Use)
+
+This code is licensed under GNU Affero General Public License v3 (AGPLv3) with additional terms.
+- Commercial use prohibited (including but not limited to sale, integration into commercial products)
+- Academic use requires clear attribution in code comments or documentation
+
+Full AGPLv3 text available in LICENSE file or at <https://www.gnu.org/licenses/agpl-3.0.html>
+"""
+
+import os
+import time
+import tracemalloc
+import fft2d
+import cv2 as cv
+import numpy as np
+
+
+def fft2d_loop(image, filter_func=None, parameters=None):
+    """The original per-pixel implementation of fft2d, kept as the reference for timing.
+    :param image: Input grayscale image (NumPy array) whose size is a power of 2.
+    :param filter_func: An optional function to apply a filter in the frequency domain.
+    :param parameters: Optional parameters for the filter function.
+    :return: A tuple containing the processed image and the frequency spectrum.
+    """
+    image = np.array(image, dtype=np.float64)
+    row, col = image.shape
+
+    for i in range(row):
+        for j in range(col):
+            image[i, j] = image[i, j] * ((-1) ** (i + j))
+
+    f_transform = np.fft.fft2(image)
+
+    if filter_func is not None:
+        filter = filter_func(f_transform, parameters)
+        for i in range(row):
+            for j in range(col):
+                f_transform[i, j] = filter[i, j] * f_transform[i, j]
+
+    f_inv_transform = np.fft.ifft2(f_transform)
+
+    result = np.zeros((row, col))
+    for i in range(row):
+        for j in range(col):
+            result[i, j] = np.real(f_inv_transform[i, j]) * ((-1) ** (i + j))
+
+    return result, f_transform
+
+
+def gaussian_lowpass(image, D0, half=False):
+    """Generates a Gaussian lowpass filter kernel for the frequency domain.
+    :param image: The input image (used to determine filter dimensions).
+    :param D0: The cutoff frequency.
+    :param half: Whether only the half-plane of the spectrum is requested (real-input mode).
+    :return: A 2D NumPy array representing the Gaussian lowpass filter kernel.
+    """
+    row, col = fft2d.full_shape(image, half)
+    u = np.arange(image.shape[0])[:, None] - row // 2
+    v = np.arange(image.shape[1])[None, :] - col // 2
+    return np.exp(-(u ** 2 + v ** 2) / (2 * D0 ** 2))
+
+
+def timing(func, *args, repeat=3):
+    """Measures the best wall time of several calls to a function.
+    :param func: The function to be timed.
+    :param args: Positional arguments passed to the function.
+    :param repeat: Number of calls; the fastest one is reported.
+    :return: A tuple containing the best time in seconds and the last return value.
+    """
+    best, value = np.inf, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, value
+
+
+# Load the test pattern and derive the smaller test images from it.
+image = cv.imread('../../images/testpattern1024.bmp', cv.IMREAD_GRAYSCALE)
+image = np.array(image, dtype=np.float64)
+
+print(f'{"Size":>10} | {"Loop (s)":>10} | {"Vectorized (s)":>14} | {"Speedup":>8} | {"Max error":>10}')
+for size in [128, 256, 512, 1024]:
+    sample = cv.resize(image, (size, size), interpolation=cv.INTER_AREA)
+
+    # The reference is only run once since it dominates the total running time.
+    loop_time, (loop_result, _) = timing(fft2d_loop, sample, gaussian_lowpass, 30, repeat=1)
+    vec_time, (vec_result, _) = timing(fft2d.fft2d, sample, gaussian_lowpass, 30)
+
+    error = np.max(np.abs(loop_result - vec_result))
+    print(f'{size:>4}x{size:<5} | {loop_time:>10.4f} | {vec_time:>14.4f} | {loop_time / vec_time:>7.1f}x | {error:>10.2e}')
+
+# Compare the complex transform with the real-input transform on the half-plane.
+print()
+print(f'{"Size":>10} | {"Complex (s)":>11} | {"Real (s)":>10} | {"Speedup":>8} | {"Spectrum (MB)":>15} | {"Max error":>10}')
+for size in [128, 256, 512, 1024]:
+    sample = cv.resize(image, (size, size), interpolation=cv.INTER_AREA)
+
+    full_time, (full_result, full_spectrum) = timing(fft2d.fft2d, sample, gaussian_lowpass, 30)
+    half_time, (half_result, half_spectrum) = timing(lambda x: fft2d.fft2d(x, gaussian_lowpass, 30, real=True), sample)
+
+    error = np.max(np.abs(full_result - half_result))
+    memory = f'{full_spectrum.nbytes / 2 ** 20:.1f} -> {half_spectrum.nbytes / 2 ** 20:.1f}'
+    print(f'{size:>4}x{size:<5} | {full_time:>11.4f} | {half_time:>10.4f} | {full_time / half_time:>7.1f}x | {memory:>15} | {error:>10.2e}')
+
+# Compare a sweep of six cutoff frequencies done call by call with a single batched call.
+D0_values = [5, 15, 30, 80, 230, 511]
+print()
+print(f'{"Size":>10} | {"Sequential (s)":>14} | {"Batched (s)":>11} | {"Speedup":>8} | {"Max error":>10}')
+for size in [128, 256, 512, 1024]:
+    sample = cv.resize(image, (size, size), interpolation=cv.INTER_AREA)
+
+    sequential = lambda x: [fft2d.fft2d(x, gaussian_lowpass, D0, real=True)[0] for D0 in D0_values]
+    batched = lambda x: fft2d.fft2d_batch(x[np.newaxis], gaussian_lowpass, parameter_list=D0_values, real=True)[0]
+    seq_time, seq_result = timing(sequential, sample)
+    batch_time, batch_result = timing(batched, sample)
+
+    error = np.max(np.abs(np.array(seq_result) - batch_result))
+    print(f'{size:>4}x{size:<5} | {seq_time:>14.4f} | {batch_time:>11.4f} | {seq_time / batch_time:>7.1f}x | {error:>10.2e}')
+
+# Compare a stream of 512x512 frames processed by fft2d with the pre-allocated FFT context.
+frames = np.array([np.roll(cv.resize(image, (512, 512), interpolation=cv.INTER_AREA), k, axis=1) for k in range(50)])
+cached_lowpass = fft2d.filter_cache(gaussian_lowpass)
+print()
+print(f'{"Mode":>10} | {"fft2d (ms/frame)":>16} | {"Context (ms/frame)":>18} | {"fft2d (MB/frame)":>16} | {"Context (MB/frame)":>18}')
+for real in [False, True]:
+    context = fft2d.context((512, 512), real)
+    context.process(frames[0], cached_lowpass, 30)  # Warm up the context and the filter cache.
+
+    stream = lambda: [fft2d.fft2d(frame, cached_lowpass, 30, real=real) for frame in frames]
+    in_place = lambda: [context.process(frame, cached_lowpass, 30) for frame in frames]
+    times, memory = [], []
+    for run in [stream, in_place]:
+        times.append(timing(run)[0] / len(frames) * 1000)
+        tracemalloc.start()
+        run()
+        memory.append(tracemalloc.get_traced_memory()[1] / len(frames) / 2 ** 20)
+        tracemalloc.stop()
+    print(f'{"Real" if real else "Complex":>10} | {times[0]:>16.3f} | {times[1]:>18.3f} | {memory[0]:>16.2f} | {memory[1]:>18.2f}')
+
+# Compare the memory held by an archive of spectra kept whole with one that keeps only the log-magnitude.
+print()
+print(f'{"Size":>10} | {"Spectra":>8} | {"Complex (MB)":>12} | {"Log-magnitude (MB)":>18}')
+for size in [256, 512]:
+    sample = cv.resize(image, (size, size), interpolation=cv.INTER_AREA)
+
+    archive = [fft2d.fft2d(np.roll(sample, k, axis=1), output='spectrum')[1] for k in range(100)]
+    whole = sum(spectrum.nbytes for spectrum in archive) / 2 ** 20
+    for spectrum in archive:
+        spectrum.materialize('log_magnitude').release()
+    released = sum(spectrum.nbytes for spectrum in archive) / 2 ** 20
+    print(f'{size:>4}x{size:<5} | {len(archive):>8} | {whole:>12.1f} | {released:>18.1f}')
+
+# Compare the numpy backend with the scipy backend on 1 to N worker threads for the 1024x1024 test patterns.
+patterns = np.array([image, np.array(cv.imread('../../images/rose1024.bmp', cv.IMREAD_GRAYSCALE), dtype=np.float64)])
+workers = sorted({2 ** k for k in range(os.cpu_count().bit_length())} | {os.cpu_count()})
+print()
+print(f'{"Backend":>14} | {"Complex (s)":>11} | {"Real (s)":>10} | {"Batch (s)":>10} | {"Speedup":>8} | {"Max error":>10}')
+reference = None
+for name, count in [('numpy', None)] + [('scipy', count) for count in workers]:
+    backend = fft2d.FFTBackend(name, count)
+    full_time, (full_result, _) = timing(lambda x: fft2d.fft2d(x, gaussian_lowpass, 30, output='result', backend=backend), image)
+    half_time, _ = timing(lambda x: fft2d.fft2d(x, gaussian_lowpass, 30, real=True, output='result', backend=backend), image)
+    batch_time, _ = timing(lambda x: fft2d.fft2d_batch(x, gaussian_lowpass, 30, real=True, output='result', backend=backend), patterns)
+
+    if reference is None:
+        reference, baseline = full_result, full_time
+    error = np.max(np.abs(full_result - reference))
+    label = name if count is None else f'{name} x{count}'
+    print(f'{label:>14} | {full_time:>11.4f} | {half_time:>10.4f} | {batch_time:>10.4f} | {baseline / full_time:>7.1f}x | {error:>10.2e}')
@@ -34,7 +34,7 @@ def fft2d(image, filter_func=None, parameters=None):
     if (row & (row - 1)) != 0 or (col & (col - 1)) != 0:
         row = 2 ** np.ceil(np.log2(row)).astype(int)
         col = 2 ** np.ceil(np.log2(col)).astype(int)
-        image = bilinear.bilinear_interpolation(image, row, col)
+        image = bilinear.bilinear_interpolation(image, col, row)
 
     # Shift the zero-frequency component to the center of the spectrum by
     # multiplying the image by (-1)^(x+y).
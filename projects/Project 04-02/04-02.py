@@ -31,13 +31,13 @@ plt.show()
 image = np.array(image, dtype=np.float64)
 
 # Perform the 2D FFT using the custom `fft2d` function.
-# The function returns the processed image and the frequency spectrum.
-result, spectrum = fft2d.fft2d(image)
+# Only the frequency spectrum is needed, so the inverse transform is skipped.
+_, spectrum = fft2d.fft2d(image, output='spectrum')
 
 # Display the frequency spectrum. A log transformation is applied to
 # enhance the visibility of lower-magnitude frequency components.
 plt.axis('off')
-plt.imshow(2 * np.log(np.abs(spectrum)), cmap='gray')
+plt.imshow(spectrum.log_magnitude, cmap='gray')
 plt.title('Frequency Spectrum')
 plt.show()
 
@@ -45,5 +45,5 @@ plt.show()
 # The DC component (zero-frequency term) of the FFT is located at the center
 # of the shifted spectrum. Its value is proportional to the sum of all pixels.
 # The mean is therefore the DC component's magnitude divided by the total number of pixels.
-mean_value = np.abs(spectrum[spectrum.shape[0]//2, spectrum.shape[1]//2]) / (spectrum.shape[0] * spectrum.shape[1])
+mean_value = spectrum.magnitude[spectrum.shape[0]//2, spectrum.shape[1]//2] / (spectrum.shape[0] * spectrum.shape[1])
 print(f"Image Mean Value from FFT: {mean_value}")
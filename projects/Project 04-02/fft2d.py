@@ -15,54 +15,584 @@ Full AGPLv3 text available in LICENSE file or at <https://www.gnu.org/licenses/a
 """
 
 import bilinear
+import functools
 import numpy as np
+from collections import OrderedDict
 
 
-def fft2d(image, filter_func=None, parameters=None):
+def centering(row, col):
+    """Builds the (-1)^(x+y) checkerboard used to center the transform.
+    :param row: Number of rows of the image.
+    :param col: Number of columns of the image.
+    :return: A (row, col) float64 array of alternating +1 and -1 values.
+    """
+    # The checkerboard is the outer product of two alternating sign vectors.
+    sign_row = 1.0 - 2.0 * (np.arange(row) % 2)
+    sign_col = 1.0 - 2.0 * (np.arange(col) % 2)
+    return np.outer(sign_row, sign_col)
+
+
+def fast_length(n):
+    """Finds the smallest even 5-smooth length (of the form 2^a * 3^b * 5^c) not less than n.
+    :param n: The minimum transform length.
+    :return: The padded transform length.
+    """
+    # Even lengths keep the (-1)^(x+y) centering exact and allow the real-input transform.
+    length = max(n + n % 2, 2)
+    while True:
+        remainder = length
+        for factor in (2, 3, 5):
+            while remainder % factor == 0:
+                remainder //= factor
+        if remainder == 1:
+            return length
+        length += 2
+
+
+def full_shape(spectrum, half=False):
+    """Recovers the shape of the full centered spectrum a filter is defined on.
+    :param spectrum: The spectrum (or any array of the same shape) passed to a filter function.
+    :param half: Whether the spectrum only holds the half-plane produced in the real-input mode.
+    :return: A tuple (row, col) of the full spectrum dimensions.
+    """
+    row, col = spectrum.shape
+    if half:
+        # The real-input transform keeps the columns 0..col/2 of an even-width spectrum.
+        col = 2 * (col - 1)
+    return row, col
+
+
+def fit(images, padding=False):
+    """Brings the last two axes of an image (or a stack of images) to a size suited to the FFT.
+    :param images: Input grayscale image, or a stack of images along the leading axes (NumPy array).
+    :param padding: Whether to zero-pad the bottom and right sides to the next even 5-smooth size
+                    instead of resampling to the next power of 2 with bilinear interpolation.
+    :return: The floating-point images of the new size, which may share memory with the input.
+    """
+    images = np.asarray(images)
+    if not np.issubdtype(images.dtype, np.floating):
+        images = images.astype(np.float64)
+    row, col = images.shape[-2:]
+
+    if padding:
+        # Zero-pad the bottom and right sides to lengths the FFT handles efficiently.
+        new_row, new_col = fast_length(row), fast_length(col)
+        if (new_row, new_col) != (row, col):
+            padded = np.zeros(images.shape[:-2] + (new_row, new_col), dtype=images.dtype)
+            padded[..., :row, :col] = images
+            images = padded
+    elif (row & (row - 1)) != 0 or (col & (col - 1)) != 0:
+        # Check if image dimensions are a power of 2 for efficient FFT computation.
+        # If not, pad the image to the next largest power of 2 using bilinear interpolation.
+        new_row = 2 ** np.ceil(np.log2(row)).astype(int)
+        new_col = 2 ** np.ceil(np.log2(col)).astype(int)
+        # The whole stack is resized in one pass that shares the index and weight tables.
+        stack = bilinear.bilinear_interpolation(images.reshape((-1, row, col)), new_col, new_row, batch=True)
+        images = stack.reshape(images.shape[:-2] + (new_row, new_col))
+    return images
+
+
+class FFTBackend:
+    """The FFT implementation used by fft2d and fft2d_batch.
+
+    The 'numpy' backend runs np.fft on a single thread. The 'scipy' backend runs scipy.fft,
+    which splits the rows and columns of a 2D transform over the given number of worker threads.
+    """
+
+    def __init__(self, name='numpy', workers=None):
+        """Selects an FFT implementation.
+        :param name: The name of the backend, 'numpy' or 'scipy'.
+        :param workers: The number of threads of the scipy backend (None for 1, -1 for every core).
+        """
+        if name == 'numpy':
+            if workers not in (None, 1):
+                raise ValueError('The numpy backend is single-threaded; use the scipy backend for workers.')
+            self.module = np.fft
+        elif name == 'scipy':
+            import scipy.fft
+            self.module = scipy.fft
+        else:
+            raise ValueError(f"Unknown FFT backend {name!r}, expected 'numpy' or 'scipy'.")
+        self.name = name
+        self.workers = workers
+
+    def __repr__(self):
+        return f'FFTBackend({self.name!r}, workers={self.workers!r})'
+
+    def _transform(self, method, x, out=None, **kwargs):
+        if self.name == 'numpy':
+            return getattr(self.module, method)(x, out=out, **kwargs)
+        # scipy.fft has no out argument, but may overwrite its input instead.
+        return getattr(self.module, method)(x, overwrite_x=out is x, workers=self.workers, **kwargs)
+
+    def fft2(self, x, out=None):
+        return self._transform('fft2', x, out)
+
+    def ifft2(self, x, out=None):
+        return self._transform('ifft2', x, out)
+
+    def rfft2(self, x):
+        return self._transform('rfft2', x)
+
+    def irfft2(self, x, s):
+        return self._transform('irfft2', x, s=s)
+
+
+# The backend used when fft2d is called without one, see set_backend.
+_backend = FFTBackend()
+
+
+def set_backend(name='numpy', workers=None):
+    """Selects the FFT backend used by every later call of fft2d and fft2d_batch.
+    :param name: The name of the backend, 'numpy' or 'scipy'.
+    :param workers: The number of threads of the scipy backend (None for 1, -1 for every core).
+    :return: The previous backend, which can be restored with set_backend(previous.name, previous.workers).
+    """
+    global _backend
+    previous, _backend = _backend, FFTBackend(name, workers)
+    return previous
+
+
+def _resolve(backend):
+    """Returns the backend of a call, given as None (the global one), a name or an FFTBackend.
+    :param backend: The requested backend.
+    :return: An FFTBackend instance.
+    """
+    if backend is None:
+        return _backend
+    if isinstance(backend, str):
+        return FFTBackend(backend)
+    return backend
+
+
+def _freeze(parameters):
+    """Converts filter parameters into a hashable cache key.
+    :param parameters: The parameters of a filter function.
+    :return: The parameters with every list replaced by a tuple.
+    """
+    if isinstance(parameters, (list, tuple)):
+        return tuple(_freeze(parameter) for parameter in parameters)
+    return parameters
+
+
+class FilterCache:
+    """A bounded LRU cache of filter transfer functions keyed by (filter, shape, half, parameters).
+
+    Only filters that depend on the shape of the spectrum (and not on its values) can be cached,
+    such as the Gaussian lowpass, notch and motion blur filters. The cached arrays are read-only.
+    """
+
+    def __init__(self, maxsize=16):
+        """Creates an empty cache.
+        :param maxsize: The maximum number of transfer functions kept before the least recently used is evicted.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __call__(self, filter_func):
+        """Wraps a filter function so that its transfer functions are memoized in this cache.
+        :param filter_func: A filter function called as filter_func(image, parameters[, half]).
+        :return: A filter function with the same signature that returns cached read-only arrays.
+        """
+        @functools.wraps(filter_func)
+        def cached(image, parameters, half=False):
+            return self.get(filter_func, image.shape, parameters, half)
+        return cached
+
+    def get(self, filter_func, shape, parameters, half=False):
+        """Returns the transfer function of a filter, building it on a cache miss.
+        :param filter_func: The filter function used to build the transfer function.
+        :param shape: The shape of the spectrum the filter is applied to.
+        :param parameters: The parameters of the filter function (numbers, strings, lists or tuples).
+        :param half: Whether only the half-plane of the spectrum is requested (real-input mode).
+        :return: The read-only transfer function (NumPy array).
+        """
+        key = (filter_func, tuple(shape), half, _freeze(parameters))
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        self.misses += 1
+        # The filter functions only read the shape of the spectrum, so a zero-stride view is enough.
+        spectrum = np.broadcast_to(np.complex128(0), tuple(shape))
+        if half:
+            H = np.array(filter_func(spectrum, parameters, half=True))
+        else:
+            H = np.array(filter_func(spectrum, parameters))
+        H.flags.writeable = False
+
+        self._entries[key] = H
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)  # Evict the least recently used transfer function.
+        return H
+
+    def clear(self):
+        """Removes all cached transfer functions and resets the hit and miss counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class Spectrum:
+    """A centered frequency spectrum whose visualization products are computed lazily.
+
+    The magnitude, log-magnitude, phase and power are derived on first access and cached.
+    Once the needed products are materialized, release() drops the complex data, which
+    bounds the memory held by archived spectra. The spectrum behaves like its complex
+    array for indexing and NumPy functions while the data is held.
+    """
+
+    _products = ('magnitude', 'log_magnitude', 'phase', 'power')
+
+    def __init__(self, data, half=False):
+        """Wraps a centered spectrum.
+        :param data: The complex spectrum (a 2D array, or a stack of them).
+        :param half: Whether the data is the half-plane of a real-input transform.
+        """
+        self.data = data
+        self.half = half
+        self.shape = data.shape
+        self._kept = set()
+
+    def _complex(self):
+        if self.data is None:
+            raise ValueError('The complex data of this spectrum has been released.')
+        return self.data
+
+    def __array__(self, dtype=None, copy=None):
+        return np.array(self._complex(), dtype=dtype, copy=copy)
+
+    def __getitem__(self, index):
+        return self._complex()[index]
+
+    @functools.cached_property
+    def magnitude(self):
+        """The magnitude |F(u, v)| of the spectrum."""
+        return np.abs(self._complex())
+
+    @functools.cached_property
+    def log_magnitude(self):
+        """The log-magnitude log(1 + |F(u, v)|), which is used to display the spectrum."""
+        return np.log1p(self.magnitude)
+
+    @functools.cached_property
+    def phase(self):
+        """The phase angle of the spectrum in radians."""
+        return np.angle(self._complex())
+
+    @functools.cached_property
+    def power(self):
+        """The power spectrum |F(u, v)|^2."""
+        return self.magnitude ** 2
+
+    @property
+    def nbytes(self):
+        """The number of bytes held by the complex data and every materialized product."""
+        held = [self.data] + [self.__dict__.get(name) for name in self._products]
+        return sum(array.nbytes for array in held if array is not None)
+
+    def materialize(self, *names):
+        """Computes the requested products so that they survive release().
+        :param names: The names of the products, e.g. 'log_magnitude' or 'phase'.
+        :return: The spectrum itself.
+        """
+        for name in names:
+            getattr(self, name)
+            self._kept.add(name)
+        return self
+
+    def release(self):
+        """Drops the complex data and every cached product that was not materialized,
+        such as the magnitude computed on the way to the log-magnitude.
+        :return: The spectrum itself.
+        """
+        self.data = None
+        for name in self._products:
+            if name not in self._kept:
+                self.__dict__.pop(name, None)
+        return self
+
+
+def _check_output(output):
+    """Validates the output selection of fft2d and fft2d_batch.
+    :param output: The requested outputs.
+    """
+    if output not in ('both', 'spectrum', 'result'):
+        raise ValueError(f"output must be 'both', 'spectrum' or 'result', not {output!r}.")
+
+
+# The shared cache used as the @fft2d.filter_cache decorator.
+filter_cache = FilterCache()
+
+
+def fft2d(image, filter_func=None, parameters=None, real=False, padding=False, crop=False, output='both', backend=None):
     """Performs a 2D Fast Fourier Transform on an image.
-    :param image: Input grayscale image (NumPy array).
+    :param image: Input grayscale image (NumPy array), which is left unmodified.
     :param filter_func: An optional function to apply a filter in the frequency domain.
     :param parameters: Optional parameters for the filter function.
-    :return: A tuple containing the processed image and the frequency spectrum.
+    :param real: Whether to use the real-input transform (rfft2). Only the left half-plane
+                 (columns 0..col/2) of the centered spectrum is computed and returned, and the
+                 filter function is called as filter_func(spectrum, parameters, half=True).
+                 The filter must be Hermitian symmetric, as every real-valued filter is.
+    :param padding: Whether to zero-pad the image to the next even 5-smooth size (see fast_length)
+                    instead of resampling it to the next power of 2 with bilinear interpolation.
+    :param crop: Whether to crop the processed image back to the input size. Only used with padding.
+    :param output: Which outputs to compute: 'both', 'spectrum' (the inverse transform is skipped)
+                   or 'result' (the inverse transform overwrites the spectrum).
+    :param backend: The FFT backend, as an FFTBackend, a backend name, or None for the one
+                    selected with set_backend.
+    :return: A tuple containing the processed image and the frequency spectrum. An output that
+             was not requested is returned as None. The spectrum is a Spectrum object.
     """
+    _check_output(output)
+    backend = _resolve(backend)
+    image = np.asarray(image)
+    origin_row, origin_col = image.shape
+    image = fit(image, padding)
     row, col = image.shape
 
-    # Check if image dimensions are a power of 2 for efficient FFT computation.
-    # If not, pad the image to the next largest power of 2 using bilinear interpolation.
-    if (row & (row - 1)) != 0 or (col & (col - 1)) != 0:
-        row = 2 ** np.ceil(np.log2(row)).astype(int)
-        col = 2 ** np.ceil(np.log2(col)).astype(int)
-        image = bilinear.bilinear_interpolation(image, row, col)
+    if real and col % 2 != 0:
+        raise ValueError('The real-input transform requires an even number of columns.')
 
     # Shift the zero-frequency component to the center of the spectrum by
-    # multiplying the image by (-1)^(x+y).
-    for i in range(row):
-        for j in range(col):
-            image[i, j] = image[i, j] * ((-1) ** (i + j))
+    # multiplying the image by (-1)^(x+y) as a single array operation.
+    sign = centering(row, col)
+    centered = image * sign.astype(image.dtype, copy=False)
 
-    # Perform the 2D Fast Fourier Transform.
-    f_transform = np.fft.fft2(image)
+    # Perform the 2D Fast Fourier Transform. The spectrum of a real image is Hermitian
+    # symmetric, so the real-input transform only keeps the left half-plane.
+    if real:
+        f_transform = backend.rfft2(centered)
+    else:
+        f_transform = backend.fft2(centered)
 
     # Apply the optional filter in the frequency domain.
     if filter_func is not None:
-        filter = filter_func(f_transform, parameters)  # Get the filter mask from the function.
-        # Element-wise multiplication of the transform with the filter.
-        for i in range(row):
-            for j in range(col):
-                f_transform[i, j] = filter[i, j] * f_transform[i, j]
+        # Get the filter mask from the function.
+        if real:
+            filter = filter_func(f_transform, parameters, half=True)
+        else:
+            filter = filter_func(f_transform, parameters)
+        # Element-wise multiplication of the whole transform with the filter.
+        f_transform *= filter
+
+    # The frequency spectrum is the centered FFT result.
+    if output == 'spectrum':
+        return None, Spectrum(f_transform, real)
+    spectrum = Spectrum(f_transform, real) if output == 'both' else None
 
-    # Perform the inverse 2D Fast Fourier Transform.
-    f_inv_transform = np.fft.ifft2(f_transform)
+    # Perform the inverse 2D Fast Fourier Transform. When the spectrum is not
+    # returned, the complex inverse transform reuses its memory.
+    if real:
+        f_inv_transform = backend.irfft2(f_transform, s=(row, col))
+    elif output == 'result':
+        f_inv_transform = backend.ifft2(f_transform, out=f_transform)
+    else:
+        f_inv_transform = backend.ifft2(f_transform)
 
     # Reconstruct the image by shifting the zero-frequency component back
     # and taking the real part of the complex result.
-    result = np.zeros((row, col))
-    for i in range(row):
-        for j in range(col):
-            result[i, j] = np.real(f_inv_transform[i, j]) * ((-1) ** (i + j))
-    result = np.float64(result)
+    result = np.real(f_inv_transform) * sign
+    if padding and crop:
+        result = result[:origin_row, :origin_col]
+
+    return result, spectrum
+
+
+def fft2d_batch(images, filter_func=None, parameters=None, real=False, padding=False, crop=False,
+                parameter_list=None, output='both', backend=None):
+    """Performs the 2D Fast Fourier Transform of fft2d on a stack of same-sized images at once.
+    :param images: Input stack of grayscale images with shape (N, H, W) (NumPy array).
+    :param filter_func: An optional function to apply a filter in the frequency domain. It is
+                        called on the spectrum of the first image, so the transfer function may
+                        only depend on the spectrum shape (all filterbank filters do).
+    :param parameters: Optional parameters for the filter function, shared by all images.
+    :param real: Whether to use the real-input transform (rfft2), as in fft2d.
+    :param padding: Whether to zero-pad instead of resampling, as in fft2d.
+    :param crop: Whether to crop the processed images back to the input size. Only used with padding.
+    :param parameter_list: An optional list of K parameter sets used instead of parameters. The K
+                           transfer functions are stacked to shape (K, H, W) and broadcast against
+                           the N spectra, so K must equal N, or one of K and N must be 1.
+    :param output: Which outputs to compute: 'both', 'spectrum' or 'result', as in fft2d.
+    :param backend: The FFT backend, as in fft2d.
+    :return: A tuple containing the stack of processed images and the stack of frequency spectra
+             as a Spectrum object. An output that was not requested is returned as None.
+    """
+    _check_output(output)
+    backend = _resolve(backend)
+    images = np.asarray(images)
+    origin_row, origin_col = images.shape[-2:]
+    images = fit(images, padding)
+    row, col = images.shape[-2:]
+
+    if real and col % 2 != 0:
+        raise ValueError('The real-input transform requires an even number of columns.')
 
-    # The frequency spectrum is the magnitude of the FFT result.
-    spectrum = f_transform
+    # The same (-1)^(x+y) checkerboard is broadcast over every image of the stack.
+    sign = centering(row, col)
+    centered = images * sign.astype(images.dtype, copy=False)
+
+    # Transform the last two axes of the whole stack with a single call.
+    if real:
+        f_transform = backend.rfft2(centered)
+    else:
+        f_transform = backend.fft2(centered)
+
+    # Build the transfer functions once and broadcast them against the spectra.
+    if filter_func is not None:
+        if parameter_list is None:
+            parameter_list = [parameters]
+            stack = False
+        else:
+            stack = True
+        filters = []
+        for item in parameter_list:
+            if real:
+                filters.append(filter_func(f_transform[0], item, half=True))
+            else:
+                filters.append(filter_func(f_transform[0], item))
+        filter = np.stack(filters) if stack else filters[0]
+        f_transform = f_transform * filter
+
+    if output == 'spectrum':
+        return None, Spectrum(f_transform, real)
+    spectrum = Spectrum(f_transform, real) if output == 'both' else None
+
+    # Perform the inverse 2D Fast Fourier Transform of every spectrum.
+    if real:
+        f_inv_transform = backend.irfft2(f_transform, s=(row, col))
+    elif output == 'result':
+        f_inv_transform = backend.ifft2(f_transform, out=f_transform)
+    else:
+        f_inv_transform = backend.ifft2(f_transform)
+
+    result = np.real(f_inv_transform) * sign
+    if padding and crop:
+        result = result[..., :origin_row, :origin_col]
 
     return result, spectrum
+
+
+def _aligned_empty(shape, dtype, alignment=64):
+    """Allocates an uninitialized array whose data starts on an aligned memory address.
+    :param shape: The shape of the array.
+    :param dtype: The data type of the array.
+    :param alignment: The alignment in bytes (64 covers cache lines and AVX-512 registers).
+    :return: An uninitialized NumPy array.
+    """
+    dtype = np.dtype(dtype)
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+    buffer = np.empty(nbytes + alignment, dtype=np.uint8)
+    offset = -buffer.ctypes.data % alignment
+    return buffer[offset:offset + nbytes].view(dtype).reshape(shape)
+
+
+class FFTContext:
+    """Pre-allocated workspaces for the repeated transforms of images of a single shape.
+
+    The forward, filter and inverse steps write into the workspaces in place, so processing a
+    stream of float64 frames with a cached float64 filter allocates no image-sized memory once
+    the context exists (NumPy still uses temporaries for single-precision transforms). The returned
+    spectrum and result are the workspaces themselves and are overwritten by the next frame.
+    The context always uses np.fft, since the scipy backend cannot write into a given output.
+    """
+
+    def __init__(self, shape, real=False, dtype=np.float64):
+        """Allocates the workspaces for one image shape.
+        :param shape: The (row, col) shape of the images. It should already suit the FFT (see fit).
+        :param real: Whether to use the real-input transform (rfft2), as in fft2d.
+        :param dtype: The floating-point type of the images (np.float32 or np.float64).
+        """
+        row, col = shape
+        if real and col % 2 != 0:
+            raise ValueError('The real-input transform requires an even number of columns.')
+        self.shape = (row, col)
+        self.real = real
+        complex_dtype = np.result_type(dtype, np.complex64)
+        spectrum_shape = (row, col // 2 + 1) if real else (row, col)
+
+        self.sign = _aligned_empty(self.shape, dtype)
+        self.sign[...] = centering(row, col)
+        self.spectrum = _aligned_empty(spectrum_shape, complex_dtype)
+        self.result = _aligned_empty(self.shape, dtype)
+        # The inverse transform runs on a copy so that the spectrum is kept intact.
+        self._inverse = _aligned_empty(spectrum_shape, complex_dtype)
+        if real:
+            self._centered = _aligned_empty(self.shape, dtype)
+
+    def forward(self, image):
+        """Centers an image and computes its spectrum in place.
+        :param image: Input grayscale image (NumPy array) of the context shape.
+        :return: The centered spectrum (the spectrum workspace).
+        """
+        if self.real:
+            np.multiply(image, self.sign, out=self._centered)
+            np.fft.rfft2(self._centered, out=self.spectrum)
+        else:
+            np.multiply(image, self.sign, out=self.spectrum)
+            np.fft.fft2(self.spectrum, out=self.spectrum)
+        return self.spectrum
+
+    def filter(self, filter_func, parameters=None):
+        """Multiplies the spectrum by a filter in place.
+        :param filter_func: A filter function, ideally memoized with filter_cache to avoid rebuilding it.
+        :param parameters: Optional parameters for the filter function.
+        :return: The filtered spectrum (the spectrum workspace).
+        """
+        if self.real:
+            filter = filter_func(self.spectrum, parameters, half=True)
+        else:
+            filter = filter_func(self.spectrum, parameters)
+        np.multiply(self.spectrum, filter, out=self.spectrum)
+        return self.spectrum
+
+    def inverse(self):
+        """Computes the real processed image from the spectrum.
+        :return: The processed image (the result workspace).
+        """
+        # The two axes are transformed one at a time, since the in-place one-axis transforms
+        # do not need the temporary arrays of the multi-axis inverse transform.
+        np.copyto(self._inverse, self.spectrum)
+        np.fft.ifft(self._inverse, axis=0, out=self._inverse)
+        if self.real:
+            np.fft.irfft(self._inverse, n=self.shape[1], axis=1, out=self.result)
+            np.multiply(self.result, self.sign, out=self.result)
+        else:
+            np.fft.ifft(self._inverse, axis=1, out=self._inverse)
+            np.multiply(self._inverse.real, self.sign, out=self.result)
+        return self.result
+
+    def process(self, image, filter_func=None, parameters=None):
+        """Runs the forward, filter and inverse steps on one image, like fft2d.
+        :param image: Input grayscale image (NumPy array) of the context shape.
+        :param filter_func: An optional function to apply a filter in the frequency domain.
+        :param parameters: Optional parameters for the filter function.
+        :return: A tuple containing the processed image and the frequency spectrum (both workspaces).
+        """
+        self.forward(image)
+        if filter_func is not None:
+            self.filter(filter_func, parameters)
+        return self.inverse(), self.spectrum
+
+
+# One context is kept for every (shape, real, dtype) combination requested through context().
+_contexts = {}
+
+
+def context(shape, real=False, dtype=np.float64):
+    """Returns the shared FFTContext of a shape, creating it on first use.
+    :param shape: The (row, col) shape of the images.
+    :param real: Whether to use the real-input transform (rfft2).
+    :param dtype: The floating-point type of the images (np.float32 or np.float64).
+    :return: The FFTContext for this shape.
+    """
+    key = (tuple(shape), real, np.dtype(dtype))
+    if key not in _contexts:
+        _contexts[key] = FFTContext(shape, real, dtype)
+    return _contexts[key]
@@ -16,29 +16,14 @@ Full AGPLv3 text available in LICENSE file or at <https://www.gnu.org/licenses/a
 
 import copy
 import fft2d
+import filterbank
 import cv2 as cv
 import numpy as np
 import matplotlib.pyplot as plt
 
 
-def gaussian_lowpass(image, D0):
-    """Generates a Gaussian lowpass filter kernel for the frequency domain.
-    :param image: The input image (used to determine filter dimensions).
-    :param D0: The cutoff frequency, where the filter's magnitude is 0.607 of its maximum value.
-    :return: A 2D NumPy array representing the Gaussian filter kernel.
-    """
-    row, col = image.shape
-    # Determine the center of the frequency spectrum.
-    u0, v0 = row // 2, col // 2
-    H = np.zeros((row, col))
-
-    for i in range(row):
-        for j in range(col):
-            # Calculate the Euclidean distance from the center of the spectrum.
-            D = np.sqrt((i - u0) ** 2 + (j - v0) ** 2)
-            # Apply the Gaussian filter formula.
-            H[i, j] = np.exp(-(D ** 2) / (2 * D0 ** 2))
-    return H
+# The frequency-domain filters come from the shared filterbank package and are memoized per shape.
+gaussian_lowpass = fft2d.filter_cache(filterbank.gaussian_lowpass)
 
 
 # Load the grayscale image and convert it to float64 for numerical stability.
@@ -58,7 +43,7 @@ D0_values = [5, 15, 30, 80, 230]
 for D0 in D0_values:
     # Use copy.deepcopy to ensure the original image is not modified in the loop.
     # The `fft2d` function is called with the Gaussian filter and the current D0.
-    result, _ = fft2d.fft2d(copy.deepcopy(image), gaussian_lowpass, D0)
+    result, _ = fft2d.fft2d(copy.deepcopy(image), gaussian_lowpass, D0, real=True, output='result')
 
     # Display the filtered image.
     plt.axis('off')
@@ -14,31 +14,15 @@ This code is licensed under GNU Affero General Public License v3 (AGPLv3) with a
 Full AGPLv3 text available in LICENSE file or at <https://www.gnu.org/licenses/agpl-3.0.html>
 """
 
-import copy
 import fft2d
+import filterbank
 import cv2 as cv
 import numpy as np
 import matplotlib.pyplot as plt
 
 
-def gaussian_lowpass(image, D0):
-    """Generates a Gaussian lowpass filter kernel for the frequency domain.
-    :param image: The input image (used to determine filter dimensions).
-    :param D0: The cutoff frequency, where the filter's magnitude is 0.607 of its maximum value.
-    :return: A 2D NumPy array representing the Gaussian lowpass filter kernel.
-    """
-    row, col = image.shape
-    # Determine the center of the frequency spectrum.
-    u0, v0 = row // 2, col // 2
-    H = np.zeros((row, col))
-
-    for i in range(row):
-        for j in range(col):
-            # Calculate the Euclidean distance from the center of the spectrum.
-            D = np.sqrt((i - u0) ** 2 + (j - v0) ** 2)
-            # Apply the Gaussian filter formula.
-            H[i, j] = np.exp(-(D ** 2) / (2 * D0 ** 2))
-    return H
+# The frequency-domain filters come from the shared filterbank package and are memoized per shape.
+gaussian_lowpass = fft2d.filter_cache(filterbank.gaussian_lowpass)
 
 
 # Load the grayscale image and convert it to float64 for numerical stability.
@@ -54,14 +38,15 @@ plt.show()
 # Define a list of cutoff frequencies to demonstrate the filter's effect.
 D0_values = [5, 15, 30, 80, 230, 511]
 
-# Iterate through each cutoff frequency to apply the high-pass filter.
-for D0 in D0_values:
-    # 1. Apply the Gaussian low-pass filter and get the blurred image result.
-    flat, _ = fft2d.fft2d(copy.deepcopy(image), gaussian_lowpass, D0)
+# 1. Apply the Gaussian low-pass filter of every cutoff frequency in one batched transform,
+# which returns the stack of blurred image results.
+flats, _ = fft2d.fft2d_batch(image[np.newaxis], gaussian_lowpass, parameter_list=D0_values, real=True, output='result')
 
-    # 2. Get the original image after it passes through the FFT/IFFT cycle with no filtering.
-    real, _ = fft2d.fft2d(copy.deepcopy(image))
+# 2. Get the original image after it passes through the FFT/IFFT cycle with no filtering.
+real, _ = fft2d.fft2d(image, real=True, output='result')
 
+# Iterate through each cutoff frequency to apply the high-pass filter.
+for D0, flat in zip(D0_values, flats):
     # 3. Subtract the low-pass result from the unfiltered image to get the high-pass result.
     # The absolute value is taken to ensure all pixel values are non-negative.
     result = np.abs(np.int64(real - flat))
@@ -16,12 +16,17 @@ Full AGPLv3 text available in LICENSE file or at <https://www.gnu.org/licenses/a
 
 import copy
 import fft2d
+import filterbank
 import bilinear
 import cv2 as cv
 import numpy as np
 import matplotlib.pyplot as plt
 
 
+# The frequency-domain filters come from the shared filterbank package and are memoized per shape.
+gaussian_lowpass = fft2d.filter_cache(filterbank.gaussian_lowpass)
+
+
 def conjugate(image, template):
     """Computes the complex conjugate of the FFT of a template.
     :param image: The main image array (used for dimensions).
@@ -31,7 +36,7 @@ def conjugate(image, template):
     row, col = image.shape
     template = copy.deepcopy(template)
     # Pad the template to the size of the image using bilinear interpolation.
-    template = bilinear.bilinear_interpolation(template, row, col)
+    template = bilinear.bilinear_interpolation(template, col, row)
 
     # Center the template for proper FFT calculation.
     for i in range(row):
@@ -46,26 +51,6 @@ def conjugate(image, template):
     return f_template
 
 
-def gaussian_lowpass(image, D0):
-    """Generates a Gaussian lowpass filter kernel for the frequency domain.
-    :param image: The input image (used to determine filter dimensions).
-    :param D0: The cutoff frequency, where the filter's magnitude is 0.607 of its maximum value.
-    :return: A 2D NumPy array representing the Gaussian lowpass filter kernel.
-    """
-    row, col = image.shape
-    # Determine the center of the frequency spectrum.
-    u0, v0 = row // 2, col // 2
-    H = np.zeros((row, col))
-
-    for i in range(row):
-        for j in range(col):
-            # Calculate the Euclidean distance from the center of the spectrum.
-            D = np.sqrt((i - u0) ** 2 + (j - v0) ** 2)
-            # Apply the Gaussian filter formula.
-            H[i, j] = np.exp(-(D ** 2) / (2 * D0 ** 2))
-    return H
-
-
 # Load the main image and the template.
 image = cv.imread('../../images/crowd.bmp', cv.IMREAD_GRAYSCALE)
 template = cv.imread('../../images/attack-on-grandma.bmp', cv.IMREAD_GRAYSCALE)
@@ -85,8 +70,10 @@ plt.show()
 A, B = image.shape
 C, D = template.shape
 
-P = A + C - 1
-Q = B + D - 1
+# Round the padded size up to the next even 5-smooth lengths for efficient FFT computation,
+# which avoids resampling the padded images to the next power of 2.
+P = fft2d.fast_length(A + C - 1)
+Q = fft2d.fast_length(B + D - 1)
 
 # Create expanded images of the required size and pad with zeros.
 expanded_image = np.zeros((P, Q), dtype=np.float32)
@@ -95,13 +82,6 @@ expanded_image[:A, :B] = image.astype(np.float32)
 expanded_template = np.zeros((P, Q), dtype=np.float32)
 expanded_template[:C, :D] = template.astype(np.float32)
 
-# Further pad dimensions to the next power of 2 for efficient FFT computation.
-if (P & (P - 1)) != 0 or (Q & (Q - 1)) != 0:
-    P = 2 ** np.ceil(np.log2(P)).astype(int)
-    Q = 2 ** np.ceil(np.log2(Q)).astype(int)
-    expanded_image = bilinear.bilinear_interpolation(expanded_image, P, Q)
-    expanded_template = bilinear.bilinear_interpolation(expanded_template, P, Q)
-
 # Display the padded images.
 plt.axis('off')
 plt.imshow(expanded_image, cmap='gray')
@@ -114,32 +94,34 @@ plt.title('Expanded Template')
 plt.show()
 
 # Calculate the baseline correlation on the unfiltered image.
-corr_image, _ = fft2d.fft2d(copy.deepcopy(expanded_image), conjugate, copy.deepcopy(expanded_template))
+corr_image, _ = fft2d.fft2d(copy.deepcopy(expanded_image), conjugate, copy.deepcopy(expanded_template), padding=True, output='result')
 max_value = np.max(corr_image)
 max_pos = np.unravel_index(np.argmax(corr_image), corr_image.shape)
 max_pos = (int(max_pos[0]), int(max_pos[1]))
 
+# Stack the image and the template so that each pair is transformed in a single batched call.
+expanded_pair = np.stack([expanded_image, expanded_template])
+
+# Get the unfiltered versions for subtraction, which do not depend on the cutoff frequency.
+(expanded_image_unfiltered, expanded_template_unfiltered), _ = fft2d.fft2d_batch(expanded_pair, real=True, padding=True, output='result')
+
 # Loop through different cutoff frequencies (D0) to analyze filtering effects.
 for i in range(12):
     # --- 1. Correlation on Smoothed (Low-pass) Images ---
     # Apply Gaussian low-pass filter to both the image and the template.
-    expanded_image_smooth, _ = fft2d.fft2d(copy.deepcopy(expanded_image), gaussian_lowpass, i + 1)
-    expanded_template_smooth, _ = fft2d.fft2d(copy.deepcopy(expanded_template), gaussian_lowpass, i + 1)
+    (expanded_image_smooth, expanded_template_smooth), _ = fft2d.fft2d_batch(expanded_pair, gaussian_lowpass, i + 1, real=True, padding=True, output='result')
     # Perform correlation on the smoothed images.
-    corr_image_smooth, _ = fft2d.fft2d(expanded_image_smooth, conjugate, expanded_template_smooth)
+    corr_image_smooth, _ = fft2d.fft2d(expanded_image_smooth, conjugate, expanded_template_smooth, padding=True, output='result')
     max_value_smooth = np.max(corr_image_smooth)
     max_pos_smooth = np.unravel_index(np.argmax(corr_image_smooth), corr_image_smooth.shape)
     max_pos_smooth = (int(max_pos_smooth[0]), int(max_pos_smooth[1]))
 
     # --- 2. Correlation on Sharpened (High-pass) Images ---
-    # Get the unfiltered versions for subtraction.
-    expanded_image_unfiltered, _ = fft2d.fft2d(copy.deepcopy(expanded_image))
-    expanded_template_unfiltered, _ = fft2d.fft2d(copy.deepcopy(expanded_template))
     # Subtract the low-pass result from the unfiltered image to get the high-pass result.
     expanded_image_sharp = np.abs(np.int64(np.floor(np.abs(np.float64(expanded_image_unfiltered) - np.float64(expanded_image_smooth)))))
     expanded_template_sharp = np.abs(np.int64(np.floor(np.abs(np.float64(expanded_template_unfiltered) - np.float64(expanded_template_smooth)))))
     # Perform correlation on the sharpened images.
-    corr_image_sharp, _ = fft2d.fft2d(copy.deepcopy(expanded_image_sharp), conjugate, copy.deepcopy(expanded_template_sharp))
+    corr_image_sharp, _ = fft2d.fft2d(copy.deepcopy(expanded_image_sharp), conjugate, copy.deepcopy(expanded_template_sharp), padding=True, output='result')
     max_value_sharp = np.max(corr_image_sharp)
     max_pos_sharp = np.unravel_index(np.argmax(corr_image_sharp), corr_image_sharp.shape)
     max_pos_sharp = (int(max_pos_sharp[0]), int(max_pos_sharp[1]))
@@ -161,3 +143,6 @@ for i in range(12):
     print(f"The smoothed maximum position: (x, y) = {max_pos_smooth}")
     print(f"The sharpening maximum position: (x, y) = {max_pos_sharp}")
     print()
+
+# Report how often the Gaussian transfer functions were reused across the sweep.
+print(f"Filter cache: {fft2d.filter_cache.hits} hits, {fft2d.filter_cache.misses} misses")
@@ -31,7 +31,7 @@ def conjugate(image, template):
     row, col = image.shape
     template = copy.deepcopy(template)
     # Pad the template to the size of the image using bilinear interpolation.
-    template = bilinear.bilinear_interpolation(template, row, col)
+    template = bilinear.bilinear_interpolation(template, col, row)
 
     # Center the template for proper FFT calculation.
     for i in range(row):
@@ -67,8 +67,10 @@ plt.show()
 A, B = image.shape
 C, D = template.shape
 
-P = A + C - 1
-Q = B + D - 1
+# Round the padded size up to the next even 5-smooth lengths for efficient FFT computation,
+# which avoids resampling the padded images to the next power of 2.
+P = fft2d.fast_length(A + C - 1)
+Q = fft2d.fast_length(B + D - 1)
 
 # Create expanded images of the required size and pad with zeros.
 expanded_image = np.zeros((P, Q), dtype=np.float32)
@@ -91,7 +93,7 @@ plt.show()
 # Perform frequency-domain correlation.
 # The `fft2d.fft2d` function implicitly handles the multiplication in the
 # frequency domain and the inverse FFT.
-corr_image, _ = fft2d.fft2d(copy.deepcopy(expanded_image), conjugate, copy.deepcopy(expanded_template))
+corr_image, _ = fft2d.fft2d(copy.deepcopy(expanded_image), conjugate, copy.deepcopy(expanded_template), padding=True, output='result')
 
 # Find the maximum value and its position in the correlation image.
 # This position corresponds to the location of the best match.
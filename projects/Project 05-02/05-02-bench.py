@@ -0,0 +1,150 @@
+"""
+Copyright (C) 2025 Fu Tszkok
+
+:module: Project 05-02 (Benchmark)
+:function: Timing of the per-pixel median filter against the vectorized filter and OpenCV,
+           of sliding window statistics against recomputing every window as it grows,
+           and of the median filter on both sides of its crossover size
+:author: Fu Tszkok
+:date: 2025-02-06
+:license: AGPLv3 + Additional Restrictions (Non-Commercial Use)
+
+This code is licensed under GNU Affero General Public License v3 (AGPLv3) with additional terms.
+- Commercial use prohibited (including but not limited to sale, integration into commercial products)
+- Academic use requires clear attribution in code comments or documentation
+
+Full AGPLv3 text available in LICENSE file or at <https://www.gnu.org/licenses/agpl-3.0.html>
+"""
+
+import time
+import tracemalloc
+import noise
+import histogram
+import cv2 as cv
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def median_loop(image):
+    """
+    A per-pixel 3x3 median filter over the zero-padded image, kept as the reference for timing.
+    :param image: Input grayscale image (NumPy array).
+    :return: The median-filtered image (NumPy array of uint8).
+    """
+    matrix = np.pad(np.float64(image), 1)
+    result = np.zeros(image.shape)
+    for i in range(image.shape[0]):
+        for j in range(image.shape[1]):
+            result[i, j] = np.median(matrix[i:i + 3, j:j + 3])
+    return np.uint8(result)
+
+
+def recomputed(image, size, mode):
+    """
+    Recomputes the median, mean and variance of every window from all of its size^2 values.
+    :param image: Input grayscale image (NumPy array of uint8).
+    :param size: The odd window size.
+    :param mode: The np.pad mode at the borders.
+    :return: A tuple containing the median, the mean and the variance of every window.
+    """
+    windows = sliding_window_view(np.pad(image, size // 2, mode=mode), (size, size))
+    windows = windows.reshape(image.shape + (-1,))
+    return np.uint8(np.median(windows, axis=2)), windows.mean(axis=2), windows.var(axis=2)
+
+
+def sliding(image, size, mode):
+    """
+    Computes the median, mean and variance of every window with sliding window histograms.
+    :param image: Input grayscale image (NumPy array of uint8).
+    :param size: The odd window size.
+    :param mode: The np.pad mode at the borders.
+    :return: A tuple containing the median, the mean and the variance of every window.
+    """
+    window = histogram.SlidingHistogram(image, size, mode)
+    median = np.zeros(image.shape, dtype=np.uint8)
+    mean, variance = np.zeros(image.shape), np.zeros(image.shape)
+    for column in window.columns():
+        median[:, column] = window.median()
+        mean[:, column] = window.mean()
+        variance[:, column] = window.variance()
+    return median, mean, variance
+
+
+def sliding_median(image, size, mode):
+    """
+    Computes only the median of every window with sliding window histograms.
+    :param image: Input grayscale image (NumPy array of uint8).
+    :param size: The odd window size.
+    :param mode: The np.pad mode at the borders.
+    :return: The median of every window (NumPy array of uint8).
+    """
+    window = histogram.SlidingHistogram(image, size, mode)
+    median = np.zeros(image.shape, dtype=np.uint8)
+    for column in window.columns():
+        median[:, column] = window.median()
+    return median
+
+
+def timing(func, *args, repeat=3):
+    """
+    Measures the best wall time of several calls to a function.
+    :param func: The function to be timed.
+    :param args: Positional arguments passed to the function.
+    :param repeat: Number of calls; the fastest one is reported.
+    :return: A tuple containing the best time in seconds and the last return value.
+    """
+    best, value = np.inf, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, value
+
+
+np.random.seed(0)
+image = cv.imread('../../images/ckt-board.bmp', cv.IMREAD_GRAYSCALE)
+noisy = noise.salt_pepper(image, 0.2, 0.2)
+
+# The 3x3 median filter of the project. OpenCV replicates the border pixels, so it is compared
+# with the 'edge' padding.
+print(f'{"Filter":>24} | {"Time (ms)":>10} | {"Identical":>9}')
+loop, reference = timing(median_loop, noisy, repeat=1)
+print(f'{"per-pixel loop":>24} | {loop * 1e3:>10.1f} | {"-":>9}')
+seconds, result = timing(histogram.median_filter, noisy, 3, 'constant')
+print(f'{"median_filter (zeros)":>24} | {seconds * 1e3:>10.1f} | {np.array_equal(reference, result)!s:>9}')
+seconds, result = timing(histogram.median_filter, noisy, 3, 'edge')
+opencv, expected = timing(cv.medianBlur, noisy, 3)
+print(f'{"median_filter (edge)":>24} | {seconds * 1e3:>10.1f} | {np.array_equal(expected, result)!s:>9}')
+print(f'{"cv.medianBlur":>24} | {opencv * 1e3:>10.1f} | {"-":>9}')
+
+# The median, mean and variance of growing windows. Recomputing touches size^2 values per pixel,
+# while the sliding histograms touch 2 * size values per pixel and step.
+print()
+print(f'{"Size":>4} | {"Recomputed (ms)":>15} | {"Sliding (ms)":>12} | {"Speedup":>7} | {"Identical":>9}')
+for size in [3, 7, 15, 25]:
+    full, (median, mean, variance) = timing(recomputed, noisy, size, 'reflect', repeat=1)
+    seconds, (median2, mean2, variance2) = timing(sliding, noisy, size, 'reflect', repeat=1)
+    identical = np.array_equal(median, median2) and np.allclose(mean, mean2) and np.allclose(variance, variance2)
+    print(f'{size:>4} | {full * 1e3:>15.1f} | {seconds * 1e3:>12.1f} | {full / seconds:>7.1f} | {identical!s:>9}')
+
+# The median alone around the size where median_filter stops partitioning the windows directly
+# and switches to the sliding histograms, with the peak memory of copying every window at once
+# and of median_filter, which copies one strip of rows at a time.
+print()
+print(f'{"Size":>4} | {"Full copy (ms)":>14} | {"Sliding (ms)":>12} | {"median_filter (ms)":>18} | '
+      f'{"Full copy (MB)":>14} | {"median_filter (MB)":>18} | {"Identical":>9}')
+for size in [3, 7, 9, 11, 15]:
+    windows = sliding_window_view(np.pad(noisy, size // 2, mode='reflect'), (size, size))
+    full, median = timing(lambda: np.median(windows.reshape(noisy.shape + (-1,)), axis=2), repeat=1)
+    seconds, median2 = timing(sliding_median, noisy, size, 'reflect', repeat=1)
+    chosen, result = timing(histogram.median_filter, noisy, size, 'reflect', repeat=1)
+    memory = []
+    for run in [lambda: np.median(windows.reshape(noisy.shape + (-1,)), axis=2),
+                lambda: histogram.median_filter(noisy, size, 'reflect')]:
+        tracemalloc.start()
+        run()
+        memory.append(tracemalloc.get_traced_memory()[1] / 2 ** 20)
+        tracemalloc.stop()
+    identical = np.array_equal(median, median2) and np.array_equal(median, result)
+    print(f'{size:>4} | {full * 1e3:>14.1f} | {seconds * 1e3:>12.1f} | {chosen * 1e3:>18.1f} | '
+          f'{memory[0]:>14.1f} | {memory[1]:>18.1f} | {identical!s:>9}')
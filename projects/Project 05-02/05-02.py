@@ -15,37 +15,12 @@ Full AGPLv3 text available in LICENSE file or at <https://www.gnu.org/licenses/a
 """
 
 import noise
+import histogram
 import cv2 as cv
 import numpy as np
 import matplotlib.pyplot as plt
 
 
-def median_filtering(image):
-    """Applies a 3x3 median filter to a grayscale image.
-    :param image: Input grayscale image (NumPy array).
-    :return: The median-filtered image.
-    """
-    # Create a padded matrix to handle image borders. The padding size is 1 pixel.
-    matrix = np.zeros((image.shape[0] + 2, image.shape[1] + 2), dtype=np.float64)
-    # Create an array to store the filtered result.
-    result = np.zeros((image.shape[0], image.shape[1]), dtype=np.float64)
-
-    # Copy the original image content into the padded matrix.
-    for i in range(image.shape[0]):
-        for j in range(image.shape[1]):
-            matrix[i + 1, j + 1] = image[i, j]
-
-    # Iterate through each pixel of the original image to apply the filter.
-    for i in range(image.shape[0]):
-        for j in range(image.shape[1]):
-            # Calculate the median of the 3x3 neighborhood centered at the current pixel.
-            result[i, j] = np.median([matrix[i - 1, j - 1], matrix[i, j - 1], matrix[i + 1, j - 1],
-                                     matrix[i - 1, j], matrix[i, j], matrix[i + 1, j],
-                                     matrix[i - 1, j], matrix[i, j + 1], matrix[i + 1, j + 1]])
-
-    return result
-
-
 # Load the original image and display it.
 image = cv.imread('../../images/ckt-board.bmp', cv.IMREAD_GRAYSCALE)
 plt.axis('off')
@@ -60,8 +35,9 @@ plt.imshow(noise, cmap='gray')
 plt.title('Salt Pepper Noise Image')
 plt.show()
 
-# Apply median filtering to the noisy image.
-filtered = median_filtering(noise)
+# Apply a 3x3 median filter to the noisy image. Windows this small are partitioned directly,
+# and the borders are padded with zeros.
+filtered = histogram.median_filter(noise, 3, mode='constant')
 plt.axis('off')
 plt.imshow(filtered, cmap='gray')
 plt.title('Median Filtered Image')
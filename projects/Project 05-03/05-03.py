@@ -16,12 +16,17 @@ Full AGPLv3 text available in LICENSE file or at <https://www.gnu.org/licenses/a
 
 import copy
 import fft2d
+import filterbank
 import bilinear
 import cv2 as cv
 import numpy as np
 import matplotlib.pyplot as plt
 
 
+# The frequency-domain filters come from the shared filterbank package and are memoized per shape.
+notch_filter = fft2d.filter_cache(filterbank.notch_filter)
+
+
 def sinusoidal_noise(image, A=100, u0=16, v0=16):
     """Adds a sinusoidal noise pattern to a grayscale image.
     :param image: Input grayscale image (NumPy array).
@@ -39,32 +44,6 @@ def sinusoidal_noise(image, A=100, u0=16, v0=16):
     return noisy_image
 
 
-def notch_filter(image, parameters):
-    """Generates an ideal Butterworth notch filter kernel.
-    :param image: The input image (used to determine filter dimensions).
-    :param parameters: A list containing [u0, v0, D0], where (u0, v0) are the
-                       notch's coordinates relative to the center and D0 is the cutoff.
-    :return: A 2D NumPy array representing the notch filter kernel.
-    """
-    row, col = image.shape
-    u0, v0, D0 = parameters
-    H = np.zeros((row, col))
-
-    for i in range(row):
-        for j in range(col):
-            # Calculate the distance from the notch center (u0, v0).
-            D1 = np.sqrt((i - row / 2 - u0) ** 2 + (j - col / 2 - v0) ** 2)
-            # Calculate the distance from the conjugate notch center (-u0, -v0).
-            D2 = np.sqrt((i - row / 2 + u0) ** 2 + (j - col / 2 + v0) ** 2)
-            if D1 == 0 or D2 == 0:
-                # Avoid division by zero at the exact notch locations.
-                H[i, j] = 10 ** -10
-            else:
-                # Apply the Butterworth notch filter formula.
-                H[i, j] = 1 / (1 + ((D0 * D0) / (D1 * D2)) ** 4)
-    return H
-
-
 # Load the original image and pad it to a power-of-2 size for efficient FFT.
 image = cv.imread('../../images/DIP.bmp', cv.IMREAD_GRAYSCALE)
 image = bilinear.bilinear_interpolation(image, 512, 512)
@@ -74,9 +53,9 @@ plt.title('Original Image')
 plt.show()
 
 # Display the frequency spectrum of the original image (without noise).
-_, spectrum = fft2d.fft2d(copy.deepcopy(image))
+_, spectrum = fft2d.fft2d(image, output='spectrum')
 plt.axis('off')
-plt.imshow(2 * np.log(np.abs(spectrum)), cmap='gray')
+plt.imshow(spectrum.log_magnitude, cmap='gray')
 plt.title('Frequency Spectrum of Original Image')
 plt.show()
 
@@ -95,9 +74,9 @@ plt.show()
 
 # Display the frequency spectrum of the noisy image.
 # Note the appearance of two bright spikes corresponding to the noise frequency.
-_, noise_spectrum = fft2d.fft2d(copy.deepcopy(noise_image))
+_, noise_spectrum = fft2d.fft2d(noise_image, output='spectrum')
 plt.axis('off')
-plt.imshow(2 * np.log(np.abs(noise_spectrum)), cmap='gray')
+plt.imshow(noise_spectrum.log_magnitude, cmap='gray')
 plt.title('Frequency Spectrum of Noise Image')
 plt.show()
 
@@ -111,7 +90,7 @@ plt.show()
 
 # Display the frequency spectrum of the denoised image, showing the removal of the spikes.
 plt.axis('off')
-plt.imshow(2 * np.log(np.abs(denoised_spectrum)), cmap='gray')
+plt.imshow(denoised_spectrum.log_magnitude, cmap='gray')
 plt.title('Frequency Spectrum of Denoised Image')
 plt.show()
 
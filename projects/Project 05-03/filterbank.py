@@ -0,0 +1,199 @@
+"""
+Copyright (C) 2025 Fu Tszkok
+
+:module: filterbank
+:function: The frequency-domain filter package from Projects 04-03 Lowpass Filtering to 05-04 Parametric Wiener Filter
+:author: Fu Tszkok
+:date: 2025-02-01
+:license: AGPLv3 + Additional Restrictions (Non-Commercial Use)
+
+Every filter follows the fft2d filter function signature filter(image, parameters, half=False)
+and is built in closed form from broadcast frequency coordinates instead of per-element loops.
+
+This code is licensed under GNU Affero General Public License v3 (AGPLv3) with additional terms.
+- Commercial use prohibited (including but not limited to sale, integration into commercial products)
+- Academic use requires clear attribution in code comments or documentation
+
+Full AGPLv3 text available in LICENSE file or at <https://www.gnu.org/licenses/agpl-3.0.html>
+"""
+
+import fft2d
+import numpy as np
+
+
+def frequency_grid(image, half=False, dtype=np.float64):
+    """Builds the centered frequency coordinates of a spectrum as broadcastable vectors.
+    :param image: The spectrum (used to determine filter dimensions).
+    :param half: Whether only the half-plane of the spectrum is requested (real-input mode).
+    :param dtype: The floating-point type of the coordinates (np.float32 or np.float64).
+    :return: A tuple (u, v) of a column vector and a row vector of centered frequencies.
+    """
+    row, col = fft2d.full_shape(image, half)
+    u = (np.arange(image.shape[0]) - row // 2).astype(dtype)[:, None]
+    v = (np.arange(image.shape[1]) - col // 2).astype(dtype)[None, :]
+    return u, v
+
+
+def distance(image, half=False, dtype=np.float64):
+    """Computes the distance D(u, v) of every frequency from the center of the spectrum.
+    :param image: The spectrum (used to determine filter dimensions).
+    :param half: Whether only the half-plane of the spectrum is requested (real-input mode).
+    :param dtype: The floating-point type of the result (np.float32 or np.float64).
+    :return: A 2D NumPy array of distances.
+    """
+    u, v = frequency_grid(image, half, dtype)
+    return np.sqrt(u ** 2 + v ** 2)
+
+
+def ideal_lowpass(image, D0, half=False, dtype=np.float64):
+    """Generates an ideal lowpass filter, which passes every frequency within D0 of the center.
+    :param image: The spectrum (used to determine filter dimensions).
+    :param D0: The cutoff frequency.
+    :param half: Whether only the half-plane of the spectrum is requested (real-input mode).
+    :param dtype: The floating-point type of the filter (np.float32 or np.float64).
+    :return: A 2D NumPy array representing the ideal lowpass filter.
+    """
+    return (distance(image, half, dtype) <= D0).astype(dtype)
+
+
+def butterworth_lowpass(image, parameters, half=False, dtype=np.float64):
+    """Generates a Butterworth lowpass filter, H = 1 / (1 + (D / D0)^(2n)).
+    :param image: The spectrum (used to determine filter dimensions).
+    :param parameters: A list containing [D0, n], the cutoff frequency and the filter order.
+    :param half: Whether only the half-plane of the spectrum is requested (real-input mode).
+    :param dtype: The floating-point type of the filter (np.float32 or np.float64).
+    :return: A 2D NumPy array representing the Butterworth lowpass filter.
+    """
+    D0, n = parameters
+    D = distance(image, half, dtype)
+    return 1 / (1 + (D / dtype(D0)) ** (2 * n))
+
+
+def gaussian_lowpass(image, D0, half=False, dtype=np.float64):
+    """Generates a Gaussian lowpass filter, H = exp(-D^2 / (2 * D0^2)).
+    :param image: The spectrum (used to determine filter dimensions).
+    :param D0: The cutoff frequency, where the filter's magnitude is 0.607 of its maximum value.
+    :param half: Whether only the half-plane of the spectrum is requested (real-input mode).
+    :param dtype: The floating-point type of the filter (np.float32 or np.float64).
+    :return: A 2D NumPy array representing the Gaussian lowpass filter.
+    """
+    u, v = frequency_grid(image, half, dtype)
+    # D^2 is formed directly, which avoids the square root of the distance.
+    H = u ** 2 + v ** 2
+    H *= dtype(-1 / (2 * D0 ** 2))
+    return np.exp(H, out=H)
+
+
+def ideal_highpass(image, D0, half=False, dtype=np.float64):
+    """Generates an ideal highpass filter, the complement of the ideal lowpass filter.
+    :param image: The spectrum (used to determine filter dimensions).
+    :param D0: The cutoff frequency.
+    :param half: Whether only the half-plane of the spectrum is requested (real-input mode).
+    :param dtype: The floating-point type of the filter (np.float32 or np.float64).
+    :return: A 2D NumPy array representing the ideal highpass filter.
+    """
+    return 1 - ideal_lowpass(image, D0, half, dtype)
+
+
+def butterworth_highpass(image, parameters, half=False, dtype=np.float64):
+    """Generates a Butterworth highpass filter, H = 1 / (1 + (D0 / D)^(2n)).
+    :param image: The spectrum (used to determine filter dimensions).
+    :param parameters: A list containing [D0, n], the cutoff frequency and the filter order.
+    :param half: Whether only the half-plane of the spectrum is requested (real-input mode).
+    :param dtype: The floating-point type of the filter (np.float32 or np.float64).
+    :return: A 2D NumPy array representing the Butterworth highpass filter.
+    """
+    return 1 - butterworth_lowpass(image, parameters, half, dtype)
+
+
+def gaussian_highpass(image, D0, half=False, dtype=np.float64):
+    """Generates a Gaussian highpass filter, the complement of the Gaussian lowpass filter.
+    :param image: The spectrum (used to determine filter dimensions).
+    :param D0: The cutoff frequency.
+    :param half: Whether only the half-plane of the spectrum is requested (real-input mode).
+    :param dtype: The floating-point type of the filter (np.float32 or np.float64).
+    :return: A 2D NumPy array representing the Gaussian highpass filter.
+    """
+    return 1 - gaussian_lowpass(image, D0, half, dtype)
+
+
+def ideal_bandreject(image, parameters, half=False, dtype=np.float64):
+    """Generates an ideal bandreject filter, which blocks the ring C0 - W/2 <= D <= C0 + W/2.
+    :param image: The spectrum (used to determine filter dimensions).
+    :param parameters: A list containing [C0, W], the radius of the band center and the band width.
+    :param half: Whether only the half-plane of the spectrum is requested (real-input mode).
+    :param dtype: The floating-point type of the filter (np.float32 or np.float64).
+    :return: A 2D NumPy array representing the ideal bandreject filter.
+    """
+    C0, W = parameters
+    D = distance(image, half, dtype)
+    return ((D < C0 - W / 2) | (D > C0 + W / 2)).astype(dtype)
+
+
+def butterworth_bandreject(image, parameters, half=False, dtype=np.float64):
+    """Generates a Butterworth bandreject filter, H = 1 / (1 + (D * W / (D^2 - C0^2))^(2n)).
+    :param image: The spectrum (used to determine filter dimensions).
+    :param parameters: A list containing [C0, W, n], the radius of the band center,
+                       the band width and the filter order.
+    :param half: Whether only the half-plane of the spectrum is requested (real-input mode).
+    :param dtype: The floating-point type of the filter (np.float32 or np.float64).
+    :return: A 2D NumPy array representing the Butterworth bandreject filter.
+    """
+    C0, W, n = parameters
+    D = distance(image, half, dtype)
+    # The ratio is infinite on the band center, where the filter reaches zero.
+    with np.errstate(divide='ignore'):
+        ratio = D * dtype(W) / (D ** 2 - dtype(C0 ** 2))
+    return 1 / (1 + ratio ** (2 * n))
+
+
+def gaussian_bandreject(image, parameters, half=False, dtype=np.float64):
+    """Generates a Gaussian bandreject filter, H = 1 - exp(-((D^2 - C0^2) / (D * W))^2).
+    :param image: The spectrum (used to determine filter dimensions).
+    :param parameters: A list containing [C0, W], the radius of the band center and the band width.
+    :param half: Whether only the half-plane of the spectrum is requested (real-input mode).
+    :param dtype: The floating-point type of the filter (np.float32 or np.float64).
+    :return: A 2D NumPy array representing the Gaussian bandreject filter.
+    """
+    C0, W = parameters
+    D = distance(image, half, dtype)
+    # The ratio is infinite at the center of the spectrum, where the filter passes everything.
+    with np.errstate(divide='ignore'):
+        ratio = (D ** 2 - dtype(C0 ** 2)) / (D * dtype(W))
+    return 1 - np.exp(-ratio ** 2)
+
+
+def notch_filter(image, parameters, half=False, dtype=np.float64):
+    """Generates a Butterworth notch reject filter for a symmetric pair of notches.
+    :param image: The spectrum (used to determine filter dimensions).
+    :param parameters: A list containing [u0, v0, D0], where (u0, v0) are the
+                       notch's coordinates relative to the center and D0 is the cutoff.
+    :param half: Whether only the half-plane of the spectrum is requested (real-input mode).
+    :param dtype: The floating-point type of the filter (np.float32 or np.float64).
+    :return: A 2D NumPy array representing the notch filter.
+    """
+    u0, v0, D0 = parameters
+    u, v = frequency_grid(image, half, dtype)
+    # Product of the distances from the notch center (u0, v0) and its conjugate (-u0, -v0).
+    D1D2 = np.sqrt((u - u0) ** 2 + (v - v0) ** 2) * np.sqrt((u + u0) ** 2 + (v + v0) ** 2)
+    with np.errstate(divide='ignore'):
+        H = 1 / (1 + (dtype(D0 * D0) / D1D2) ** 4)
+    # Use a tiny value instead of zero at the exact notch locations.
+    H[D1D2 == 0] = 10 ** -10
+    return H
+
+
+def motion_blur(image, parameters, half=False, dtype=np.float64):
+    """Generates the frequency-domain degradation function of uniform linear motion.
+    :param image: The spectrum (used to determine filter dimensions).
+    :param parameters: A list containing [T, a, b], where T is the exposure time
+                       and (a, b) are the motion components.
+    :param half: Whether only the half-plane of the spectrum is requested (real-input mode).
+    :param dtype: The floating-point type of the real and imaginary parts (np.float32 or np.float64).
+    :return: A complex 2D NumPy array representing the motion blur filter.
+    """
+    T, a, b = parameters
+    u, v = frequency_grid(image, half, dtype)
+    phase = np.pi * (u * dtype(a) + v * dtype(b))
+    # Add a small epsilon to the denominator to avoid division by zero.
+    return np.sin(T * phase) / (phase + dtype(1e-6)) * np.exp(-1j * T * phase)
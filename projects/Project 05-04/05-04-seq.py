@@ -15,6 +15,7 @@ Full AGPLv3 text available in LICENSE file or at <https://www.gnu.org/licenses/a
 """
 
 import fft2d
+import filterbank
 import noise
 import bilinear
 
@@ -24,6 +25,11 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 
+# The frequency-domain filters come from the shared filterbank package and are memoized per shape.
+gaussian_lowpass = fft2d.filter_cache(filterbank.gaussian_lowpass)
+motion_blur = fft2d.filter_cache(filterbank.motion_blur)
+
+
 def SNR(original, denoised):
     """Calculates the Signal-to-Noise Ratio (SNR) between two images.
     :param original: The original, undegraded image.
@@ -46,52 +52,16 @@ def SNR(original, denoised):
     return temp1 / temp2
 
 
-def gaussian_lowpass(image, D0):
-    """Generates a Gaussian lowpass filter kernel for the frequency domain.
-    :param image: The input image (used to determine filter dimensions).
-    :param D0: The cutoff frequency.
-    :return: A 2D NumPy array representing the Gaussian lowpass filter kernel.
-    """
-    row, col = image.shape
-    u0, v0 = row // 2, col // 2
-    H = np.zeros((row, col))
-
-    for i in range(row):
-        for j in range(col):
-            D = np.sqrt((i - u0) ** 2 + (j - v0) ** 2)
-            H[i, j] = np.exp(-(D ** 2) / (2 * D0 ** 2))
-    return H
-
-
-def motion_blur(image, parameters):
-    """Generates a frequency-domain filter for motion blur.
-    :param image: The original image (used to determine filter dimensions).
-    :param parameters: A list containing [T, a, b], where T is the exposure time
-                       and (a, b) are the motion components.
-    :return: A complex 2D NumPy array representing the motion blur filter.
-    """
-    row, col = image.shape
-    T, a, b = parameters
-    H = np.zeros((row, col), dtype=complex)
-
-    for u in range(row):
-        for v in range(col):
-            u_centered = u - row // 2
-            v_centered = v - col // 2
-            numerator = np.sin(np.pi * T * (u_centered * a + v_centered * b))
-            denominator = np.pi * (u_centered * a + v_centered * b) + 1e-6
-            H[u, v] = numerator / denominator * np.exp(-1j * np.pi * T * (u_centered * a + v_centered * b))
-    return H
-
-
-def wiener_filter(image, blured_core, enhance_factor=0.75):
+def wiener_filter(image, blured_core, enhance_factor=0.75, half=False):
     """Generates a Wiener filter for image restoration.
     :param image: The FFT of the degraded image (noisy and blurred).
     :param blured_core: The known motion blur filter (H) in the frequency domain.
     :param enhance_factor: A factor to adjust the filter's behavior.
+    :param half: Whether only the half-plane of the spectrum is requested (real-input mode).
     :return: A complex 2D NumPy array representing the Wiener filter.
     """
-    H = blured_core
+    # In the real-input mode only the left half-plane of the full blur core is used.
+    H = blured_core[:, :image.shape[1]] if half else blured_core
     H_magnitude_squared = np.abs(H) ** 2
     # The signal power spectrum is approximated by the magnitude of the noisy image's spectrum.
     signal_power = np.abs(image) ** 2
@@ -128,7 +98,7 @@ b = 0.1
 
 # --- Step 1: Image Degradation ---
 # Simulate motion blur and add Gaussian noise to the image.
-motion_image, _ = fft2d.fft2d(copy.deepcopy(image), motion_blur, [T, a, b])
+motion_image, _ = fft2d.fft2d(copy.deepcopy(image), motion_blur, [T, a, b], real=True, output='result')
 plt.axis('off')
 plt.imshow(motion_image, cmap='gray')
 plt.title('Motion Blured Image')
@@ -144,9 +114,9 @@ plt.show()
 # --- Step 2: Image Restoration ---
 # Apply a two-stage filtering process.
 # First, apply a Gaussian low-pass filter to smooth out some of the high-frequency noise.
-filtered, _ = fft2d.fft2d(copy.deepcopy(noisy_image), gaussian_lowpass, 20)
+filtered, _ = fft2d.fft2d(copy.deepcopy(noisy_image), gaussian_lowpass, 20, real=True, output='result')
 # Then, apply the Wiener filter to deblur the image.
-filtered, _ = fft2d.fft2d(copy.deepcopy(filtered), wiener_filter, motion_blur(copy.deepcopy(image), [T, a, b]))
+filtered, _ = fft2d.fft2d(copy.deepcopy(filtered), wiener_filter, motion_blur(copy.deepcopy(image), [T, a, b]), output='result')
 plt.axis('off')
 plt.imshow(filtered, cmap='gray')
 plt.title('Filtered Image')
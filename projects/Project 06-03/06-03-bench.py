@@ -0,0 +1,86 @@
+"""
+Copyright (C) 2025 Fu Tszkok
+
+:module: Project 06-03 (Benchmark)
+:function: Timing of the per-channel histogram normalization against lookup-table histogram
+           specification on a color image and on batches of color frames
+:author: Fu Tszkok
+:date: 2025-02-06
+:license: AGPLv3 + Additional Restrictions (Non-Commercial Use)
+
+This code is licensed under GNU Affero General Public License v3 (AGPLv3) with additional terms.
+- Commercial use prohibited (including but not limited to sale, integration into commercial products)
+- Academic use requires clear attribution in code comments or documentation
+
+Full AGPLv3 text available in LICENSE file or at <https://www.gnu.org/licenses/agpl-3.0.html>
+"""
+
+import time
+import histogram
+import cv2 as cv
+import numpy as np
+
+
+def normalization_loop(image, target_histogram):
+    """
+    The original histogram normalization, which interpolates every pixel, kept as the reference for timing.
+    :param image: Input grayscale image (NumPy array).
+    :param target_histogram: A NumPy array representing the target histogram.
+    :return: The normalized image (NumPy array of uint8).
+    """
+    hist, bins = np.histogram(image.flatten(), bins=256, range=[0, 256], density=True)
+    cdf = hist.cumsum()
+    cdf_normalized = cdf / cdf[-1]
+    target_cdf = target_histogram.cumsum()
+    target_cdf_normalized = target_cdf / target_cdf[-1]
+    mapping = np.interp(cdf_normalized, target_cdf_normalized, np.arange(256))
+    normalized_image = np.interp(image.flatten(), np.arange(256), mapping)
+    normalized_image = normalized_image.reshape(image.shape)
+    return np.clip(normalized_image, 0, 255).astype(np.uint8)
+
+
+def channels_loop(frames, target_histogram):
+    """
+    Normalizes every channel of every frame with its own call of the original normalization.
+    :param frames: A batch of color frames (NumPy array of uint8 with shape (N, H, W, C)).
+    :param target_histogram: A NumPy array representing the target histogram.
+    :return: The normalized frames (NumPy array of uint8).
+    """
+    result = np.zeros_like(frames)
+    for n in range(frames.shape[0]):
+        for k in range(frames.shape[3]):
+            result[n, :, :, k] = normalization_loop(frames[n, :, :, k], target_histogram)
+    return result
+
+
+def timing(func, *args, repeat=3):
+    """
+    Measures the best wall time of several calls to a function.
+    :param func: The function to be timed.
+    :param args: Positional arguments passed to the function.
+    :param repeat: Number of calls; the fastest one is reported.
+    :return: A tuple containing the best time in seconds and the last return value.
+    """
+    best, value = np.inf, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, value
+
+
+# The target is the average of the equalized channel histograms, as in the project.
+image = cv.cvtColor(cv.imread('../../images/bottom_left_stream.bmp'), cv.COLOR_BGR2RGB)
+equalized = np.dstack([histogram.equalization(image[:, :, k])[0] for k in range(3)])
+target = np.floor(histogram.histogram(equalized, channels=True)[0].sum(axis=0) / 3)
+
+# Batches of frames made from the image by flips and brightness shifts.
+variants = [image, image[::-1], image[:, ::-1], cv.add(image, 40), cv.subtract(image, 40), 255 - image]
+print(f'{"Frames":>6} | {"Size":>13} | {"Per channel (ms)":>16} | {"Specification (ms)":>18} | {"Speedup":>7} | {"Identical":>9}')
+for count in [1, 6, 24]:
+    frames = np.stack([variants[n % len(variants)] for n in range(count)])
+    loop, reference = timing(channels_loop, frames, target)
+    single, result = timing(histogram.specification, frames, target, True)
+    label = 'x'.join(str(size) for size in frames.shape[1:])
+    identical = np.array_equal(reference, result)
+    print(f'{count:>6} | {label:>13} | {loop * 1e3:>16.1f} | {single * 1e3:>18.1f} | {loop / single:>7.1f} | {identical!s:>9}')
@@ -29,10 +29,9 @@ plt.show()
 
 # Split the image into its individual R, G, and B color channels.
 R, G, B = image[:, :, 0], image[:, :, 1], image[:, :, 2]
-# Calculate and display the histograms for each original color channel.
-red_hist, r_x = histogram.histogram(R)
-green_hist, g_x = histogram.histogram(G)
-blue_hist, b_x = histogram.histogram(B)
+# Calculate and display the histograms for each original color channel in a single pass.
+(red_hist, green_hist, blue_hist), r_x = histogram.histogram(image, channels=True)
+g_x = b_x = r_x
 
 plt.figure(figsize=(15, 9))
 plt.subplot(1, 3, 1)
@@ -65,13 +64,22 @@ plt.show()
 
 # --- Method 1: Independent Histogram Equalization of each channel ---
 # Apply histogram equalization to each RGB channel separately.
-R_eq = histogram.equalization(R)
-G_eq = histogram.equalization(G)
-B_eq = histogram.equalization(B)
+R_eq, R_trans = histogram.equalization(R)
+G_eq, G_trans = histogram.equalization(G)
+B_eq, B_trans = histogram.equalization(B)
+
+# Display the transformation functions of the three channels together.
+for trans, color in [(R_trans, 'red'), (G_trans, 'green'), (B_trans, 'blue')]:
+    plt.plot(r_x, trans, '-', color=color)
+plt.xlim([0, 255])
+plt.ylim([0, 255])
+plt.title('Histogram Equalization Transformation Functions')
+plt.show()
+
+# Merge the equalized channels back to form a color image.
+image_eq = cv.merge([R_eq, G_eq, B_eq])
 # Calculate and display the histograms of the equalized components.
-red_eq_hist, r_x = histogram.histogram(R_eq)
-green_eq_hist, g_x = histogram.histogram(G_eq)
-blue_eq_hist, b_x = histogram.histogram(B_eq)
+(red_eq_hist, green_eq_hist, blue_eq_hist), r_x = histogram.histogram(image_eq, channels=True)
 
 plt.figure(figsize=(15, 9))
 plt.subplot(1, 3, 1)
@@ -85,8 +93,7 @@ plt.bar(b_x, blue_eq_hist)
 plt.title('Histogram of Equalized Blue Component')
 plt.show()
 
-# Merge the equalized channels back to form a color image.
-image_eq = cv.merge([R_eq, G_eq, B_eq])
+# Display the color image of the equalized channels.
 plt.axis('off')
 plt.imshow(image_eq)
 plt.title('Equalized Image Through Different Components')
@@ -104,13 +111,10 @@ plt.title('Average Histogram')
 plt.show()
 
 # Apply histogram normalization to each original color channel, using the average histogram as the target.
-R_nor = histogram.normalization(R, ave_hist)
-G_nor = histogram.normalization(G, ave_hist)
-B_nor = histogram.normalization(B, ave_hist)
+# Every channel gets its own lookup table, and all three are applied in one gather.
+image_nor = histogram.specification(image, ave_hist)
 # Calculate and display the histograms of the normalized components.
-red_nor_hist, r_x = histogram.histogram(R_nor)
-green_nor_hist, g_x = histogram.histogram(G_nor)
-blue_nor_hist, b_x = histogram.histogram(B_nor)
+(red_nor_hist, green_nor_hist, blue_nor_hist), r_x = histogram.histogram(image_nor, channels=True)
 
 plt.figure(figsize=(15, 9))
 plt.subplot(1, 3, 1)
@@ -124,8 +128,7 @@ plt.bar(b_x, blue_nor_hist)
 plt.title('Histogram of Normalized Blue Component')
 plt.show()
 
-# Merge the normalized channels to form the final enhanced color image.
-image_nor = cv.merge([R_nor, G_nor, B_nor])
+# Display the final enhanced color image.
 plt.axis('off')
 plt.imshow(image_nor)
 plt.title('Normalized Image Through Average Histogram')